@@ -0,0 +1,83 @@
+# Blit throughput of the game sprites before and after the display-format
+# conversion done by Spritesheet.convertSurface. Runs on the real display,
+# since the gain depends on its pixel format; under --dummy the display has
+# the default surface format and only the 24-bit copies show a difference.
+#
+# run from the repository root: python -m benchmarks.blit [seconds] [--dummy]
+import argparse
+import os
+import time
+
+import pygame
+
+from classes.Sprites import Sprites
+
+
+def spriteImages(collection):
+    images = []
+    for sprite in collection.values():
+        if sprite.animation is not None:
+            images.extend(sprite.animation.images)
+        elif sprite.image is not None:
+            images.append(sprite.image)
+    return images
+
+
+def depth24(image):
+    # the same sprite as a 24-bit surface, the format image.load gives an
+    # RGB PNG, so every blit has to go through a format conversion
+    copy = pygame.Surface(image.get_size(), 0, 24)
+    copy.blit(image, (0, 0))
+    colorkey = image.get_colorkey()
+    if colorkey is not None:
+        copy.set_colorkey(colorkey)
+    return copy
+
+
+def formatName(image):
+    name = "{:d}-bit".format(image.get_bitsize())
+    if image.get_flags() & pygame.RLEACCEL:
+        name += " RLE"
+    return name
+
+
+def blitsPerSecond(images, target, seconds):
+    blits = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for i, image in enumerate(images):
+            target.blit(image, ((i * 32) % 608, (i // 19) * 32 % 448))
+        blits += len(images)
+    return blits / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("seconds", nargs="?", type=float, default=2.0)
+    parser.add_argument("--dummy", action="store_true",
+                        help="use SDL's dummy video driver instead of a window")
+    args = parser.parse_args()
+    if args.dummy:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    sprites = Sprites()
+    # loaded before set_mode: what every sprite looked like before conversion
+    raw = spriteImages(sprites.loadSprites(sprites.urlList))
+    screen = pygame.display.set_mode((640, 480))
+    # the game draws into a surface in the display's format
+    target = pygame.Surface((640, 480)).convert()
+    converted = spriteImages(sprites.loadSprites(sprites.urlList))
+    unconverted24 = [depth24(image) for image in raw]
+
+    print("driver:    {} ({})".format(pygame.display.get_driver(), formatName(screen)))
+    print("sprites:   {:d}".format(len(converted)))
+    after = blitsPerSecond(converted, target, args.seconds)
+    for label, images in (("raw", raw), ("24-bit", unconverted24)):
+        before = blitsPerSecond(images, target, args.seconds)
+        print("{:<10} {:,.0f} blits/s ({}), converted is {:.2f}x".format(
+            label + ":", before, formatName(images[0]), after / before))
+    print("converted: {:,.0f} blits/s ({})".format(after, formatName(converted[0])))
+
+
+if __name__ == "__main__":
+    main()
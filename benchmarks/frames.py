@@ -0,0 +1,159 @@
+# Frame time of whole levels: every frame runs the logic step and draws into
+# an off-screen surface, with Mario running right and hopping. Covers the
+# shipped levels and the synthetic ones from benchmarks.stress. Peak memory is
+# the peak resident size of a fresh process that plays only that level, so it
+# counts SDL surface pixels and not just the Python heap.
+#
+# run from the repository root:
+#   python -m benchmarks.frames [levelName ...] [--frames N] [--batch-physics]
+import argparse
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.stress import writeLevels
+from classes.Input import InputState
+from classes.Simulation import Simulation
+from classes.WalkerPhysics import WalkerPhysics
+
+LEVELS = ["Level1-1", "Level1-2", "Level1-boss"]
+
+
+class ScriptedInput:
+    # stands in for an InputReplay: run right, jump for 10 of every 40 steps
+    def __init__(self):
+        self.frames = 0
+
+    def next(self):
+        self.frames += 1
+        return InputState(1, self.frames % 40 < 10)
+
+
+def play(levelName, frames, screen, batchPhysics=False):
+    simulation = Simulation(levelName, screen)
+    if batchPhysics:
+        simulation.level.walkerPhysics = WalkerPhysics(simulation.level)
+    mario = simulation.mario
+    mario.input.replay = ScriptedInput()
+    times = []
+    for _ in range(frames):
+        # keep Mario out of harm's way so every level runs its full length
+        mario.invincibilityFrames = 2
+        if mario.restart:
+            break
+        start = time.perf_counter()
+        simulation.update()
+        simulation.draw()
+        if not mario.restart:
+            # a pit still kills him; the death animation is not a frame
+            times.append(time.perf_counter() - start)
+    # the mixer thread must not be left playing sounds that are about to be freed
+    pygame.mixer.stop()
+    return simulation, times
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def measure(levelName, frames, screen, batchPhysics=False):
+    # the level's debug prints are not what is being measured
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulation, times = play(levelName, frames, screen, batchPhysics)
+        entities = len(simulation.level.entityList)
+    peak = peakRss(levelName, frames, batchPhysics)
+    return {
+        "frames": len(times),
+        "fps": len(times) / sum(times),
+        "p50": percentile(times, 0.5) * 1000,
+        "p99": percentile(times, 0.99) * 1000,
+        "peak": peak / 1024.0 / 1024.0 if peak is not None else float("nan"),
+        "entities": entities,
+    }
+
+
+def peakRss(levelName, frames, batchPhysics=False):
+    # this process has already played other levels, so the level runs again
+    # on its own in a child process and reports that process's peak
+    if resource is None:
+        return None
+    command = [sys.executable, "-m", "benchmarks.frames", levelName,
+               "--frames", str(frames), "--peak-rss"]
+    if batchPhysics:
+        command.append("--batch-physics")
+    output = subprocess.run(command, stdout=subprocess.PIPE, check=True).stdout
+    return int(output.split()[-1])
+
+
+def maxRss():
+    # Linux carries ru_maxrss over from the parent through fork and exec, so
+    # the high-water mark of this process's own memory is read there instead
+    if os.path.exists("/proc/self/status"):
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("levels", nargs="*", help="default: every shipped and stress level")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--batch-physics", action="store_true",
+                        help="move walking mobs with classes.WalkerPhysics")
+    # used by peakRss: play one level (already written) and print the peak
+    parser.add_argument("--peak-rss", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    pygame.mixer.pre_init(44100, -16, 2, 4096)
+    pygame.init()
+    pygame.display.set_mode((640, 480))
+    screen = pygame.Surface((640, 480))
+    if args.peak_rss:
+        with contextlib.redirect_stdout(io.StringIO()):
+            play(args.levels[0], args.frames, screen, args.batch_physics)
+        print(maxRss())
+        return
+    stress = writeLevels()
+    levels = args.levels or LEVELS + stress
+    try:
+        report(levels, args.frames, screen, args.batch_physics)
+    finally:
+        # generated for this run only, keep them out of the menu
+        for levelName in stress:
+            os.remove("./levels/{}.json".format(levelName))
+
+
+def report(levels, frames, screen, batchPhysics):
+    print(
+        "{:<19}{:>8}{:>10}{:>10}{:>10}{:>14}{:>10}".format(
+            "level", "frames", "fps", "p50 ms", "p99 ms", "peak RSS MiB", "entities"
+        )
+    )
+    for levelName in levels:
+        result = measure(levelName, frames, screen, batchPhysics)
+        print(
+            "{:<19}{frames:>8d}{fps:>10,.0f}{p50:>10.2f}{p99:>10.2f}{peak:>14.1f}{entities:>10d}".format(
+                levelName, **result
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
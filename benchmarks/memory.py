@@ -0,0 +1,76 @@
+# Memory held per entity: builds a batch of each entity kind through the
+# Level.add* methods and reports the traced bytes per instance, then the
+# same for every entity of the coin stress level.
+#
+# run from the repository root: python -m benchmarks.memory [count]
+import contextlib
+import io
+import json
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.stress import coinLevel
+from classes.Dashboard import Dashboard
+from classes.Level import Level
+from classes.Sound import Sound
+
+
+def tracedBytes(build):
+    # bytes still allocated after build() returns, kept alive by its result
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    pygame.mixer.pre_init(44100, -16, 2, 4096)
+    pygame.init()
+    pygame.display.set_mode((640, 480))
+    screen = pygame.Surface((640, 480))
+    dashboard = Dashboard("./img/font.png", 8, screen)
+    level = Level(screen, Sound(), dashboard, seed=0)
+    level.sprites.spriteCollection
+    with contextlib.redirect_stdout(io.StringIO()):
+        level.loadLevel("Level1-1")
+
+    kinds = [
+        ("Coin", lambda i: level.addCoin(i % 60, 5)),
+        ("Goomba", lambda i: level.addGoomba(12, i % 60)),
+        ("Koopa", lambda i: level.addKoopa(12, i % 60)),
+        ("CoinBox", lambda i: level.addCoinBox(i % 60, 5)),
+    ]
+    print("{:<10}{:>14}".format("entity", "bytes each"))
+    for name, add in kinds:
+        size, _ = tracedBytes(lambda: [add(i) for i in range(count)])
+        level.spawnQueue = []
+        print("{:<10}{:>14,.0f}".format(name, size / count))
+
+    # a whole level: every segment built at once, so every entity exists
+    with open("./levels/LevelStress-memory.json", "w") as jsonFile:
+        json.dump(coinLevel(count // 9 + 6), jsonFile)
+    try:
+        level.streamMargin = 10 ** 6
+        with contextlib.redirect_stdout(io.StringIO()):
+            size, _ = tracedBytes(lambda: level.loadLevel("LevelStress-memory"))
+    finally:
+        os.remove("./levels/LevelStress-memory.json")
+    entities = len(level.entityList)
+    print(
+        "coin level: {:d} entities, {:,.0f} bytes each (tiles included)".format(
+            entities, size / entities
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
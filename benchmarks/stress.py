@@ -0,0 +1,116 @@
+# Synthetic stress levels in the levels/*.json schema. They are generated
+# into ./levels/LevelStress-*.json (ignored by git) because Level.loadLevel
+# only loads from there, which also lists them in the menu.
+#
+# run from the repository root: python -m benchmarks.stress
+import json
+import random
+
+
+def emptyLevel(length):
+    return {
+        "id": 0,
+        "length": length,
+        "level": {
+            "objects": {"bush": [], "sky": [], "cloud": [], "pipe": [], "ground": []},
+            "layers": {
+                "sky": {"x": [0, length], "y": [0, 13]},
+                "ground": {"x": [0, length], "y": [14, 16]},
+            },
+            "entities": {
+                "CoinBox": [],
+                "coinBrick": [],
+                "coin": [],
+                "Goomba": [],
+                "Koopa": [],
+                "RandomBox": [],
+            },
+        },
+    }
+
+
+def longLevel(length=1000):
+    # a long map full of scenery, pipes and platforms but only a few mobs
+    rnd = random.Random(1)
+    data = emptyLevel(length)
+    objects = data["level"]["objects"]
+    entities = data["level"]["entities"]
+    for x in range(4, length - 8, 9):
+        objects["bush"].append([x, 12])
+        objects["cloud"].append([x + rnd.randrange(4), rnd.randrange(2, 7)])
+    for x in range(20, length - 20, 40):
+        objects["pipe"].append([x, rnd.choice([9, 10, 12]), 4])
+        for platformX in range(x + 10, x + 16):
+            objects["ground"].append([platformX, 9])
+        entities["CoinBox"].append([x + 18, 8])
+        entities["coinBrick"].append([x + 19, 9])
+        entities["RandomBox"].append([x + 20, 5, "RedMushroom"])
+        # Goomba and Koopa entries are [y, x]
+        entities["Goomba"].append([12, x + 25])
+        entities["Koopa"].append([12, x + 30])
+    return data
+
+
+def mobLevel(length=200, goombas=300, koopas=200):
+    # hundreds of walking mobs crowding the same screens
+    rnd = random.Random(2)
+    data = emptyLevel(length)
+    entities = data["level"]["entities"]
+    for _ in range(goombas):
+        entities["Goomba"].append([rnd.randrange(4, 12), rnd.randrange(16, length - 2)])
+    for _ in range(koopas):
+        entities["Koopa"].append([rnd.randrange(4, 12), rnd.randrange(16, length - 2)])
+    return data
+
+
+def coinLevel(length=200):
+    # a coin on every free tile above the ground
+    data = emptyLevel(length)
+    coins = data["level"]["entities"]["coin"]
+    for x in range(6, length):
+        for y in range(3, 12):
+            coins.append([x, y])
+    return data
+
+
+def bossLevel(length=60, bosses=6):
+    # several bosses on one screen, each firing at Mario every few frames
+    data = emptyLevel(length)
+    objects = data["level"]["objects"]
+    objects["boss_spawn"] = [[12 + i * 2, 12 - i % 3] for i in range(bosses)]
+    for x in range(24, 32):
+        objects["ground"].append([x, 9])
+    return data
+
+
+def bulletLevel(length=60, bosses=40):
+    # a wall of bosses keeping over a thousand fires in the air, some of them
+    # flying into the platforms and pipes in between
+    data = bossLevel(length, 0)
+    objects = data["level"]["objects"]
+    objects["boss_spawn"] = [[8 + i % 20, 4 + i // 20 * 5] for i in range(bosses)]
+    objects["pipe"] = [[2, 10, 4], [30, 11, 3]]
+    return data
+
+
+LEVELS = {
+    "LevelStress-long": longLevel,
+    "LevelStress-mobs": mobLevel,
+    "LevelStress-coins": coinLevel,
+    "LevelStress-boss": bossLevel,
+    "LevelStress-bullets": bulletLevel,
+}
+
+
+def writeLevels(directory="./levels"):
+    names = []
+    for name, build in LEVELS.items():
+        with open("{}/{}.json".format(directory, name), "w") as jsonFile:
+            json.dump(build(), jsonFile)
+        names.append(name)
+    return names
+
+
+if __name__ == "__main__":
+    for name in writeLevels():
+        print("wrote levels/{}.json".format(name))
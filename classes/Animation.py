@@ -1,4 +1,8 @@
 class Animation:
+    __slots__ = (
+        "images", "timer", "index", "image", "idleSprite", "airSprite", "deltaTime"
+    )
+
     def __init__(self, images, idleSprite=None, airSprite=None, deltaTime=7):
         self.images = images
         self.timer = 0
@@ -22,3 +26,30 @@ class Animation:
 
     def inAir(self):
         self.image = self.airSprite
+
+
+class AnimationClock:
+    # one step counter for every looping animation in the level: entities of
+    # a kind share a single Animation and look their current image up here
+    # instead of each ticking a copy of their own
+    def __init__(self):
+        self.frame = 0
+        self.animations = {}
+
+    def tick(self):
+        self.frame += 1
+
+    def shared(self, images, deltaTime=7):
+        key = (tuple(id(image) for image in images), deltaTime)
+        if key not in self.animations:
+            self.animations[key] = Animation(images, deltaTime=deltaTime)
+        return self.animations[key]
+
+    def image(self, animation, start=0):
+        # the image animation.update() would have reached after the steps since start
+        return animation.images[
+            (self.frame - start) // animation.deltaTime % len(animation.images)
+        ]
+
+
+clock = AnimationClock()
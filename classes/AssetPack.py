@@ -0,0 +1,142 @@
+import json
+import os
+import struct
+
+import pygame
+
+from classes.Animation import Animation
+from classes.Sprite import Sprite
+from classes.Spritesheet import convertSurface
+
+MAGIC = b"MPAK"
+VERSION = 1
+HEADER = struct.Struct("<4sII")
+
+
+class AssetPack:
+    # contents of each pack file (None when missing or stale), read once and
+    # shared by every AssetPack()
+    contents = {}
+
+    def __init__(self, path="./sprites/assets.pack"):
+        self.path = path
+
+    def load(self):
+        if self.path not in AssetPack.contents:
+            AssetPack.contents[self.path] = self.read()
+        return AssetPack.contents[self.path]
+
+    def read(self):
+        try:
+            with open(self.path, "rb") as packFile:
+                data = packFile.read()
+        except (IOError, OSError):
+            return None
+        if len(data) < HEADER.size:
+            return None
+        magic, version, indexLength = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            return None
+        index = json.loads(data[HEADER.size:HEADER.size + indexLength].decode("utf-8"))
+        # fall back to slicing the sheets if any source changed after the build
+        for source, mtime in index["sources"].items():
+            if not os.path.exists(source) or os.path.getmtime(source) > mtime:
+                return None
+        base = HEADER.size + indexLength
+        images = []
+        for offset, width, height, colorkey in index["images"]:
+            start = base + offset
+            image = pygame.image.fromstring(
+                data[start:start + width * height * 3], (width, height), "RGB"
+            )
+            if colorkey is not None:
+                image.set_colorkey(colorkey, pygame.RLEACCEL)
+            images.append(convertSurface(image))
+        return index, images
+
+    def spriteCollection(self):
+        contents = self.load()
+        if contents is None:
+            return None
+        index, images = contents
+        collection = {}
+        for name, entry in index["sprites"].items():
+            animation = None
+            if entry["animation"] is not None:
+                animation = Animation(
+                    [images[i] for i in entry["animation"]["images"]],
+                    deltaTime=entry["animation"]["deltaTime"],
+                )
+            image = images[entry["image"]] if entry["image"] is not None else None
+            collection[name] = Sprite(
+                image, entry["collision"], animation, entry["redrawBg"]
+            )
+        return collection
+
+    def font(self, filePath):
+        contents = self.load()
+        if contents is None:
+            return None
+        index, images = contents
+        glyphs = index["fonts"].get(filePath)
+        if glyphs is None:
+            return None
+        return {char: images[i] for char, i in glyphs.items()}
+
+    def write(self, collection, fonts, sources):
+        images = []
+        blob = bytearray()
+        seen = {}
+        sprites = {}
+        for name, sprite in collection.items():
+            animation = None
+            if sprite.animation is not None:
+                animation = {
+                    "images": [
+                        self.addImage(image, images, blob, seen)
+                        for image in sprite.animation.images
+                    ],
+                    "deltaTime": sprite.animation.deltaTime,
+                }
+            sprites[name] = {
+                "image": self.addImage(sprite.image, images, blob, seen),
+                "collision": sprite.colliding,
+                "redrawBg": sprite.redrawBackground,
+                "animation": animation,
+            }
+        fontIndex = {}
+        for filePath, charSprites in fonts.items():
+            fontIndex[filePath] = {
+                char: self.addImage(image, images, blob, seen)
+                for char, image in charSprites.items()
+            }
+        index = json.dumps(
+            {
+                "sources": {source: os.path.getmtime(source) for source in sources},
+                "images": images,
+                "sprites": sprites,
+                "fonts": fontIndex,
+            }
+        ).encode("utf-8")
+        with open(self.path, "wb") as packFile:
+            packFile.write(HEADER.pack(MAGIC, VERSION, len(index)))
+            packFile.write(index)
+            packFile.write(blob)
+        AssetPack.contents.pop(self.path, None)
+
+    def addImage(self, image, images, blob, seen):
+        if image is None:
+            return None
+        if id(image) not in seen:
+            colorkey = image.get_colorkey()
+            images.append(
+                [
+                    len(blob),
+                    image.get_width(),
+                    image.get_height(),
+                    list(colorkey)[:3] if colorkey is not None else None,
+                ]
+            )
+            blob.extend(pygame.image.tostring(image, "RGB"))
+            seen[id(image)] = len(images) - 1
+        return seen[id(image)]
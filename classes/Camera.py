@@ -7,10 +7,18 @@ class Camera:
         self.entity = entity
         self.x = self.pos.x * 32
         self.y = self.pos.y * 32
+        self.previousX = self.pos.x
 
     def move(self):
+        self.previousX = self.pos.x
         xPosFloat = self.entity.getPosIndexAsFloat().x
-        if 10 < xPosFloat < 50:
+        # follow until the last screen of the level is in view
+        if 10 < xPosFloat < self.entity.levelObj.levelLength - 10:
             self.pos.x = -xPosFloat + 10
         self.x = self.pos.x * 32
         self.y = self.pos.y * 32
+
+    def interpolate(self, alpha):
+        # stand-in camera for drawing in between the previous and the current move
+        x = self.previousX + (self.pos.x - self.previousX) * alpha
+        return Camera(Vec2D(x, self.pos.y), self.entity)
@@ -1,75 +1,82 @@
 class Collider:
-    def __init__(self, entity, level):
-        self.entity = entity
-        self.level = level.level
+    # tile collision against the level's solidity grid; it keeps no state of
+    # its own, so one per level (Level.collider) serves every entity
+    def __init__(self, level):
         self.levelObj = level
-        self.result = []
 
-    def checkX(self):
-        if self.leftLevelBorderReached() or self.rightLevelBorderReached():
+    def checkX(self, entity):
+        if self.leftLevelBorderReached(entity) or self.rightLevelBorderReached(entity):
             return
-        try:
-            rows = [
-                self.level[self.entity.getPosIndex().y],
-                self.level[self.entity.getPosIndex().y + 1],
-                self.level[self.entity.getPosIndex().y + 2],
-            ]
-        except Exception:
+        grid = self.levelObj.solidity
+        rect = entity.rect
+        posY = rect.y // 32
+        if not -len(grid) <= posY < len(grid) - 2:
             return
-        for row in rows:
-            tiles = row[self.entity.getPosIndex().x : self.entity.getPosIndex().x + 2]
-            for tile in tiles:
-                if tile.rect is not None:
-                    if self.entity.rect.colliderect(tile.rect):
-                        if self.entity.vel.x > 0:
-                            self.entity.rect.right = tile.rect.left
-                            self.entity.vel.x = 0
-                        if self.entity.vel.x < 0:
-                            self.entity.rect.left = tile.rect.right
-                            self.entity.vel.x = 0
+        for y in range(max(posY, 0), posY + 3):
+            for left, top in self.solidTiles(grid[y], y, rect.x // 32):
+                if self.overlaps(rect, left, top):
+                    if entity.vel.x > 0:
+                        rect.right = left
+                        entity.vel.x = 0
+                    if entity.vel.x < 0:
+                        rect.left = left + 32
+                        entity.vel.x = 0
 
-    def checkY(self):
-        self.entity.onGround = False
-        
-        try:
-            rows = [
-                self.level[self.entity.getPosIndex().y],
-                self.level[self.entity.getPosIndex().y + 1],
-                self.level[self.entity.getPosIndex().y + 2],
-            ]
-        except Exception:
+    def checkY(self, entity):
+        entity.onGround = False
+        grid = self.levelObj.solidity
+        rect = entity.rect
+        posY = rect.y // 32
+        if not -len(grid) <= posY < len(grid) - 2:
             try:
-                self.entity.gameOver()
+                entity.gameOver()
             except Exception:
-                self.entity.alive = None
+                entity.alive = None
             return
-        for row in rows:
-            tiles = row[self.entity.getPosIndex().x : self.entity.getPosIndex().x + 2]
-            for tile in tiles:
-                if tile.rect is not None:
-                    if self.entity.rect.colliderect(tile.rect):
-                        if self.entity.vel.y > 0:
-                            self.entity.onGround = True
-                            self.entity.rect.bottom = tile.rect.top
-                            self.entity.vel.y = 0
-                            # reset jump on bottom
-                            if self.entity.traits is not None:
-                                if "JumpTrait" in self.entity.traits:
-                                    self.entity.traits["JumpTrait"].reset()
-                                if "bounceTrait" in self.entity.traits:
-                                    self.entity.traits["bounceTrait"].reset()
-                        if self.entity.vel.y < 0:
-                            self.entity.rect.top = tile.rect.bottom
-                            self.entity.vel.y = 0
+        for y in range(max(posY, 0), posY + 3):
+            for left, top in self.solidTiles(grid[y], y, rect.x // 32):
+                if self.overlaps(rect, left, top):
+                    if entity.vel.y > 0:
+                        entity.onGround = True
+                        rect.bottom = top
+                        entity.vel.y = 0
+                        # reset jump on bottom
+                        if entity.traits is not None:
+                            if "JumpTrait" in entity.traits:
+                                entity.traits["JumpTrait"].reset()
+                            if "bounceTrait" in entity.traits:
+                                entity.traits["bounceTrait"].reset()
+                    if entity.vel.y < 0:
+                        rect.top = top + 32
+                        entity.vel.y = 0
 
-    def rightLevelBorderReached(self):
-        if self.entity.getPosIndexAsFloat().x > self.levelObj.levelLength - 1:
-            self.entity.rect.x = (self.levelObj.levelLength - 1) * 32
-            self.entity.vel.x = 0
+    def solidTiles(self, row, y, x):
+        # pixel position of the solid tiles in the two columns under the entity;
+        # a grid value v marks a tile whose top sits v - 1 pixels above its cell
+        tiles = []
+        if x < 0:
+            return tiles
+        for tileX in range(x, min(x + 2, len(row))):
+            if row[tileX]:
+                tiles.append((tileX * 32, y * 32 + 1 - row[tileX]))
+        return tiles
+
+    def overlaps(self, rect, left, top):
+        return (
+            rect.left < left + 32
+            and left < rect.right
+            and rect.top < top + 32
+            and top < rect.bottom
+        )
+
+    def rightLevelBorderReached(self, entity):
+        if entity.rect.x / 32.0 > self.levelObj.levelLength - 1:
+            entity.rect.x = (self.levelObj.levelLength - 1) * 32
+            entity.vel.x = 0
             return True
 
-    def leftLevelBorderReached(self):
-        if self.entity.rect.x < 0:
-            self.entity.rect.x = 0
-            self.entity.vel.x = 0
+    def leftLevelBorderReached(self, entity):
+        if entity.rect.x < 0:
+            entity.rect.x = 0
+            entity.vel.x = 0
             return True
@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 import pygame
 
 from classes.Font import Font
@@ -13,34 +15,74 @@ class Dashboard(Font):
         self.coins = 0
         self.ticks = 0
         self.time = 0
+        self.textCache = OrderedDict()
+        self.textCacheSize = 64
+        self.hud = None
+        self.hudState = None
+        # set whenever the HUD surface is rebuilt, cleared by the main loop
+        # once that frame has been presented
+        self.dirty = True
 
     def update(self):
-        self.drawText("MARIO", 50, 20, 15)
-        self.drawText(self.pointString(), 50, 37, 15)
-
-        self.drawText("@x{}".format(self.coinString()), 225, 37, 15)
-
-        self.drawText("WORLD", 380, 20, 15)
-        self.drawText(str(self.levelName), 395, 37, 15)
-
-        self.drawText("TIME", 520, 20, 15)
-        if self.state != "menu":
-            self.drawText(self.timeString(), 535, 37, 15)
-
         # update Time
         self.ticks += 1
         if self.ticks == 60:
             self.ticks = 0
             self.time += 1
 
+    def draw(self):
+        # the HUD is only re-rendered when something on it changed
+        hudState = (self.points, self.coins, self.time, self.levelName, self.state)
+        if hudState != self.hudState:
+            self.hudState = hudState
+            self.renderHud()
+        self.screen.blit(self.hud, (0, 0))
+
+    def renderHud(self):
+        if self.hud is None:
+            self.hud = pygame.Surface((640, 52))
+            self.hud.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        self.hud.fill((0, 0, 0))
+        self.dirty = True
+        self.hud.blit(self.renderText("MARIO", 15), (50, 20))
+        self.hud.blit(self.renderText(self.pointString(), 15), (50, 37))
+
+        self.hud.blit(self.renderText("@x{}".format(self.coinString()), 15), (225, 37))
+
+        self.hud.blit(self.renderText("WORLD", 15), (380, 20))
+        self.hud.blit(self.renderText(str(self.levelName), 15), (395, 37))
+
+        self.hud.blit(self.renderText("TIME", 15), (520, 20))
+        if self.state != "menu":
+            self.hud.blit(self.renderText(self.timeString(), 15), (535, 37))
+
     def drawText(self, text, x, y, size):
+        self.screen.blit(self.renderText(text, size), (x, y))
+
+    def renderText(self, text, size):
+        # rendered strings are kept in a small LRU cache so unchanged text is a single blit
+        key = (text, size)
+        surface = self.textCache.get(key)
+        if surface is not None:
+            self.textCache.move_to_end(key)
+            return surface
+        positions = []
+        x = 0
         for char in text:
-            charSprite = pygame.transform.scale(self.charSprites[char], (size, size))
-            self.screen.blit(charSprite, (x, y))
+            positions.append((self.glyph(char, size), x))
             if char == " ":
                 x += size//2
             else:
                 x += size
+        width = max([x] + [pos + size for _, pos in positions])
+        surface = pygame.Surface((width, size))
+        surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        for glyph, pos in positions:
+            surface.blit(glyph, (pos, 0))
+        self.textCache[key] = surface
+        if len(self.textCache) > self.textCacheSize:
+            self.textCache.popitem(last=False)
+        return surface
 
     def coinString(self):
         return "{:02d}".format(self.coins)
@@ -0,0 +1,50 @@
+import pygame
+
+from classes.Log import log
+
+
+class DebugOverlay:
+    # F8 debug view: projectile markers along the top edge and a line of
+    # counters. Off by default and nothing here runs until it is switched on;
+    # the font is made once and each distinct text is rendered only once
+    def __init__(self):
+        self.enabled = False
+        self.font = None
+        self.texts = {}
+        self.hudRebuilds = 0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        log.verbose = self.enabled
+
+    def text(self, text):
+        surface = self.texts.get(text)
+        if surface is None:
+            if self.font is None:
+                self.font = pygame.font.Font(None, 20)
+            if len(self.texts) > 256:
+                self.texts = {}
+            surface = self.font.render(text, True, (255, 255, 255), (0, 0, 0))
+            self.texts[text] = surface
+        return surface
+
+    def draw(self, surface, level, camera):
+        if not self.enabled:
+            return
+        if level.dashboard.dirty:
+            self.hudRebuilds += 1
+        for projectile in level.projectiles.active:
+            pygame.draw.circle(
+                surface, (255, 240, 50), (int(projectile.rect.x + camera.x), 16), 5
+            )
+        surface.blit(
+            self.text(
+                "debug  entities {:d}  bullets {:d}  hud rebuilds {:d}".format(
+                    len(level.entityList), len(level.projectiles.active), self.hudRebuilds
+                )
+            ),
+            (10, 90),
+        )
+
+
+debug = DebugOverlay()
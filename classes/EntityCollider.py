@@ -1,13 +1,11 @@
 class EntityCollider:
-    def __init__(self, entity):
-        self.entity = entity
-
-    def check(self, target):
-        if self.entity.rect.colliderect(target.rect):
-            return self.determineSide(target.rect, self.entity.rect)
+    # keeps no state of its own; every entity shares entityCollider below
+    def check(self, entity, target):
+        if entity.rect.colliderect(target.rect):
+            return self.determineSide(target.rect, entity.rect, entity)
         return CollisionState(False, False)
 
-    def determineSide(self, rect1, rect2):
+    def determineSide(self, rect1, rect2, entity):
         if (
             rect1.collidepoint(rect2.bottomleft)
             or rect1.collidepoint(rect2.bottomright)
@@ -18,12 +16,17 @@ class EntityCollider:
             ) or rect2.collidepoint((rect1.midright[0] / 2, rect1.midright[1] / 2)):
                 return CollisionState(True, False)
             else:
-                if self.entity.vel.y > 0:
+                if entity.vel.y > 0:
                     return CollisionState(True, True)
         return CollisionState(True, False)
 
 
 class CollisionState:
+    __slots__ = ("isColliding", "isTop")
+
     def __init__(self, _isColliding, _isTop):
         self.isColliding = _isColliding
         self.isTop = _isTop
+
+
+entityCollider = EntityCollider()
@@ -1,12 +1,22 @@
+from classes.AssetPack import AssetPack
 from classes.Spritesheet import Spritesheet
+from classes.Transform import transforms
 import pygame
 
 
 class Font(Spritesheet):
+    # sliced glyphs, shared per font file
+    fonts = {}
+
     def __init__(self, filePath, size):
         Spritesheet.__init__(self, filename=filePath)
         self.chars = " !\"#$%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~"
-        self.charSprites = self.loadFont()
+        if filePath not in Font.fonts:
+            charSprites = AssetPack().font(filePath)
+            if charSprites is None:
+                charSprites = self.loadFont()
+            Font.fonts[filePath] = charSprites
+        self.charSprites = Font.fonts[filePath]
 
     def loadFont(self):
         font = {}
@@ -31,3 +41,6 @@ class Font(Spritesheet):
             )
             charAt += 1
         return font
+
+    def glyph(self, char, size):
+        return transforms.scale(self.charSprites[char], (size, size))
@@ -2,51 +2,111 @@ import pygame
 from pygame.locals import *
 import sys
 
+from classes.Debug import debug
+from classes.Log import log
+from classes.Profiler import profiler
+
+
+class InputState:
+    # everything the game reads from the player in one logic step
+    def __init__(self, direction=0, jumping=False, boost=False,
+                 leftClick=False, rightClick=False, mouseX=0, mouseY=0,
+                 toBoss=False, bossLevel=False):
+        self.direction = direction
+        self.jumping = jumping
+        self.boost = boost
+        self.leftClick = leftClick
+        self.rightClick = rightClick
+        self.mouseX = mouseX
+        self.mouseY = mouseY
+        # debug keys: F2 teleports to the boss, F3 loads the boss level
+        self.toBoss = toBoss
+        self.bossLevel = bossLevel
+
 
 class Input:
     def __init__(self, entity):
         self.mouseX = 0
         self.mouseY = 0
         self.entity = entity
+        # an InputRecorder to write every step to, or an InputReplay to read
+        # the steps from instead of the keyboard and mouse
+        self.recorder = None
+        self.replay = None
 
     def checkForInput(self):
         events = pygame.event.get()
-        self.checkForKeyboardInput()
-        self.checkForMouseInput(events)
-        self.checkForQuitAndRestartInputEvents(events)
+        if self.replay is not None:
+            state = self.replay.next()
+            if state is None:
+                # end of the recording
+                self.entity.restart = True
+                state = InputState()
+        else:
+            state = self.readInputState(events)
+        if self.recorder is not None:
+            self.recorder.record(state)
+        self.checkForKeyboardInput(state)
+        self.checkForMouseInput(state)
+        self.checkForDebugInput(state)
+        if self.replay is not None:
+            self.checkForQuitEvent(events)
+        else:
+            self.checkForQuitAndRestartInputEvents(events)
 
-    def checkForKeyboardInput(self):
+    def readInputState(self, events):
         pressedKeys = pygame.key.get_pressed()
 
         if pressedKeys[K_LEFT] or pressedKeys[K_h] and not pressedKeys[K_RIGHT]:
-            self.entity.traits["goTrait"].direction = -1
+            direction = -1
         elif pressedKeys[K_RIGHT] or pressedKeys[K_l] and not pressedKeys[K_LEFT]:
-            self.entity.traits["goTrait"].direction = 1
+            direction = 1
         else:
-            self.entity.traits['goTrait'].direction = 0
+            direction = 0
 
         isJumping = pressedKeys[K_SPACE] or pressedKeys[K_UP] or pressedKeys[K_k]
-        self.entity.traits['jumpTrait'].jump(isJumping)
-
-        self.entity.traits['goTrait'].boost = pressedKeys[K_LSHIFT]
 
-    def checkForMouseInput(self, events):
         mouseX, mouseY = pygame.mouse.get_pos()
-        if self.isRightMouseButtonPressed(events):
+        return InputState(
+            direction,
+            bool(isJumping),
+            bool(pressedKeys[K_LSHIFT]),
+            self.isLeftMouseButtonPressed(events),
+            self.isRightMouseButtonPressed(events),
+            mouseX,
+            mouseY,
+            self.isKeyPressed(events, pygame.K_F2),
+            self.isKeyPressed(events, pygame.K_F3),
+        )
+
+    def checkForKeyboardInput(self, state):
+        self.entity.traits['goTrait'].direction = state.direction
+        self.entity.traits['jumpTrait'].jump(state.jumping)
+        self.entity.traits['goTrait'].boost = state.boost
+
+    def checkForMouseInput(self, state):
+        self.mouseX, self.mouseY = state.mouseX, state.mouseY
+        if state.rightClick:
             self.entity.levelObj.addKoopa(
-                mouseY / 32, mouseX / 32 - self.entity.camera.pos.x
+                self.mouseY / 32, self.mouseX / 32 - self.entity.camera.pos.x
             )
             self.entity.levelObj.addGoomba(
-                mouseY / 32, mouseX / 32 - self.entity.camera.pos.x
+                self.mouseY / 32, self.mouseX / 32 - self.entity.camera.pos.x
             )
             self.entity.levelObj.addRedMushroom(
-                mouseY / 32, mouseX / 32 - self.entity.camera.pos.x
+                self.mouseY / 32, self.mouseX / 32 - self.entity.camera.pos.x
             )
-        if self.isLeftMouseButtonPressed(events):
+        if state.leftClick:
             self.entity.levelObj.addCoin(
-                mouseX / 32 - self.entity.camera.pos.x, mouseY / 32
+                self.mouseX / 32 - self.entity.camera.pos.x, self.mouseY / 32
             )
 
+    def checkForQuitEvent(self, events):
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
     def checkForQuitAndRestartInputEvents(self, events):
         for event in events:
             if event.type == pygame.QUIT:
@@ -56,58 +116,69 @@ class Input:
                 (event.key == pygame.K_ESCAPE or event.key == pygame.K_F5):
                 self.entity.pause = True
                 self.entity.pauseObj.createBackgroundBlur()
-            # Debug: F2 teleport to boss (if present)
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
-                # find boss in level
+            # F9 toggles the frame-time profiler overlay, F10 dumps its timings
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                profiler.toggle()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F10:
+                print("Frame timings written to", profiler.dumpCsv())
+            # F8 toggles the debug overlay and verbose logging
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F8:
+                debug.toggle()
+
+    def checkForDebugInput(self, state):
+        # F2/F3 are part of the recorded input, since they move Mario
+        # Debug: F2 teleport to boss (if present)
+        if state.toBoss:
+            # find boss in level
+            boss = None
+            for ent in self.entity.levelObj.entityList:
+                if ent.__class__.__name__ == 'Boss':
+                    boss = ent
+                    break
+            if boss:
+                # place mario near boss
+                try:
+                    self.entity.rect.x = boss.rect.x - 100
+                    self.entity.rect.y = boss.rect.y
+                except Exception:
+                    pass
+        # Debug: F3 load boss level and teleport Mario there
+        if state.bossLevel:
+            try:
+                self.entity.levelObj.loadLevel('Level1-boss')
+                log.info("Loaded Level1-boss via F3")
+                # find boss spawn in level objects
+                # find boss entity in the loaded level and teleport Mario near it
                 boss = None
                 for ent in self.entity.levelObj.entityList:
                     if ent.__class__.__name__ == 'Boss':
                         boss = ent
                         break
                 if boss:
-                    # place mario near boss
+                    # place mario a bit to the left of boss and on top of the tile
                     try:
                         self.entity.rect.x = boss.rect.x - 100
-                        self.entity.rect.y = boss.rect.y
-                    except Exception:
-                        pass
-            # Debug: F3 load boss level and teleport Mario there
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
-                try:
-                    self.entity.levelObj.loadLevel('Level1-boss')
-                    print('Loaded Level1-boss via F3')
-                    # find boss spawn in level objects
-                    # find boss entity in the loaded level and teleport Mario near it
-                    boss = None
-                    for ent in self.entity.levelObj.entityList:
-                        if ent.__class__.__name__ == 'Boss':
-                            boss = ent
-                            break
-                    if boss:
-                        # place mario a bit to the left of boss and on top of the tile
+                        # place Mario above boss's y so he's not embedded inside a tile
+                        self.entity.rect.y = boss.rect.y - self.entity.rect.height - 1
+                        # reset velocities and ensure Mario is not stuck inside tiles
                         try:
-                            self.entity.rect.x = boss.rect.x - 100
-                            # place Mario above boss's y so he's not embedded inside a tile
-                            self.entity.rect.y = boss.rect.y - self.entity.rect.height - 1
-                            # reset velocities and ensure Mario is not stuck inside tiles
-                            try:
-                                self.entity.vel.x = 0
-                                self.entity.vel.y = 0
-                                # run a collision check to snap Mario onto nearest ground tile
-                                self.entity.collision.checkY()
-                                self.entity.invincibilityFrames = 60
-                            except Exception:
-                                pass
+                            self.entity.vel.x = 0
+                            self.entity.vel.y = 0
+                            # run a collision check to snap Mario onto nearest ground tile
+                            self.entity.collision.checkY(self.entity)
+                            self.entity.invincibilityFrames = 60
                         except Exception:
-                            # fallback to center of boss tile
-                            self.entity.rect.x = boss.rect.x
-                            self.entity.rect.y = boss.rect.y
-                    else:
-                        # fallback: teleport mario to tile 12,10 (narrow boss map default)
-                        self.entity.rect.x = 12 * 32 - 100
-                        self.entity.rect.y = 10 * 32
-                except Exception as e:
-                    print('Failed to load boss level via F3:', e)
+                            pass
+                    except Exception:
+                        # fallback to center of boss tile
+                        self.entity.rect.x = boss.rect.x
+                        self.entity.rect.y = boss.rect.y
+                else:
+                    # fallback: teleport mario to tile 12,10 (narrow boss map default)
+                    self.entity.rect.x = 12 * 32 - 100
+                    self.entity.rect.y = 10 * 32
+            except Exception as e:
+                log.info("Failed to load boss level via F3: {}", e)
 
     def isLeftMouseButtonPressed(self, events):
         return self.checkMouse(events, 1)
@@ -115,6 +186,12 @@ class Input:
     def isRightMouseButtonPressed(self, events):
         return self.checkMouse(events, 3)
 
+    def isKeyPressed(self, events, key):
+        for e in events:
+            if e.type == pygame.KEYDOWN and e.key == key:
+                return True
+        return False
+
     def checkMouse(self, events, button):
         for e in events:
             if e.type == pygame.MOUSEBUTTONUP and e.button == button:
@@ -1,6 +1,13 @@
 import json
+import random
+
 import pygame
 
+from classes.Animation import clock
+from classes.Collider import Collider
+from classes.Log import log
+from classes.Profiler import profiler
+from classes.Projectiles import Projectiles
 from classes.Sprites import Sprites
 from classes.Tile import Tile
 from entities.Coin import Coin
@@ -13,195 +20,429 @@ from entities.RandomBox import RandomBox
 
 
 class Level:
-    def __init__(self, screen, sound, dashboard):
+    def __init__(self, screen, sound, dashboard, seed=None):
         self.sprites = Sprites()
         self.dashboard = dashboard
         self.sound = sound
         self.screen = screen
         self.level = None
         self.levelLength = 0
+        self.name = None
+        # every load reseeds the level's own generator, so a level plays out
+        # the same for a given seed (see classes/Replay.py)
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.random = random.Random(self.seed)
         self.entityList = []
+        self.spawnQueue = []
+        self.despawned = False
+        self.projectiles = Projectiles(self)
+        # set by whoever creates Mario, for the boss to aim at
+        self.player = None
+        # the level is built and dropped in segments of chunkWidth columns as
+        # the camera moves; streamMargin extra segments stay built on each side
+        self.chunkWidth = 16
+        self.streamMargin = 1
+        # entities further than this many pixels off screen are not updated
+        self.activationMargin = 96
+        self.segmentTiles = []
+        self.pendingSpawns = []
+        self.parkedEntities = []
+        self.loadedSegments = set()
+        self.building = range(0)
+        self.chunks = []
+        self.animatedTiles = []
+        self.solidity = []
+        self.collider = Collider(self)
+        # optional classes.WalkerPhysics.WalkerPhysics moving all walking mobs
+        # in one batch instead of one at a time
+        self.walkerPhysics = None
+        self.entityGrid = {}
 
     def loadLevel(self, levelname):
-        print(f"Loading level: {levelname}")
+        log.info("Loading level: {}", levelname)
         # reset current level state so reloading doesn't duplicate entities
         self.entityList = []
+        self.spawnQueue = []
+        self.despawned = False
+        self.projectiles = Projectiles(self)
+        self.entityGrid = {}
         self.level = None
         self.levelLength = 0
-        print("Level state reset: cleared entityList and level data")
+        self.name = levelname
+        self.random.seed(self.seed)
         with open("./levels/{}.json".format(levelname)) as jsonData:
             data = json.load(jsonData)
-            self.loadLayers(data)
-            self.loadObjects(data)
-            self.loadEntities(data)
-            self.levelLength = data["length"]
+        self.loadLayers(data)
+        self.loadObjects(data)
+        self.loadEntities(data)
+        self.levelLength = data["length"]
+        self.streamSegments(0)
+        self.flushEntities()
+
+    def loadLayers(self, data):
+        # only the layout is kept here; the tiles of a column are created when
+        # its segment is built
+        layers = data["level"]["layers"]
+        self.skyRows = range(*layers["sky"]["y"])
+        self.groundRows = range(*layers["ground"]["y"])
+        width = len(range(*layers["sky"]["x"]))
+        height = len(self.skyRows) + len(self.groundRows)
+        segments = -(-width // self.chunkWidth)
+        self.level = [[None] * width for _ in range(height)]
+        self.solidity = [bytearray(width) for _ in range(height)]
+        self.segmentTiles = [[] for _ in range(segments)]
+        self.pendingSpawns = [[] for _ in range(segments)]
+        self.parkedEntities = [[] for _ in range(segments)]
+        self.loadedSegments = set()
+        self.chunks = [None] * segments
+        self.animatedTiles = [None] * segments
+
+    def loadObjects(self, data):
+        objects = data["level"]["objects"]
+        for x, y in objects.get("bush", []):
+            self.indexTiles(self.addBushSprite, x, 3, x, y)
+        for x, y in objects.get("cloud", []):
+            self.indexTiles(self.addCloudSprite, x, 3, x, y)
+        for x, y, z in objects.get("pipe", []):
+            self.indexTiles(self.addPipeSprite, x, 2, x, y, z)
+        for x, y in objects.get("sky", []):
+            self.indexTiles(self.addSkyTile, x, 1, x, y)
+        for x, y in objects.get("ground", []):
+            self.indexTiles(self.addGroundTile, x, 1, x, y)
 
     def loadEntities(self, data):
         # Defensive handling when 'entities' or 'objects' keys are missing
         entities = data.get("level", {}).get("entities", {}) or {}
-        print("loadEntities: entity keys:", list(entities.keys()))
+        log.debug("loadEntities: entity keys: {}", list(entities.keys()))
+
+        # blocks are solid tiles with an entity drawn on top
+        for x, y in entities.get("CoinBox", []):
+            self.indexTiles(self.addBlockTile, x, 1, x, y)
+        for x, y in entities.get("coinBrick", []):
+            self.indexTiles(self.addBlockTile, x, 1, x, y)
+        for item_entry in entities.get("RandomBox", []):
+            if len(item_entry) >= 3:
+                self.indexTiles(self.addBlockTile, item_entry[0], 1, item_entry[0], item_entry[1])
 
         # Add entity types if present
         for x, y in entities.get("CoinBox", []):
-            self.addCoinBox(x, y)
-        for x, y in entities.get("Goomba", []):
-            self.addGoomba(x, y)
-        for x, y in entities.get("Koopa", []):
-            self.addKoopa(x, y)
+            self.indexSpawn(self.addCoinBox, x, x, y)
+        # Goomba and Koopa entries are [y, x]
+        for y, x in entities.get("Goomba", []):
+            self.indexSpawn(self.addGoomba, x, y, x)
+        for y, x in entities.get("Koopa", []):
+            self.indexSpawn(self.addKoopa, x, y, x)
         for x, y in entities.get("coin", []):
-            self.addCoin(x, y)
+            self.indexSpawn(self.addCoin, x, x, y)
         for x, y in entities.get("coinBrick", []):
-            self.addCoinBrick(x, y)
+            self.indexSpawn(self.addCoinBrick, x, x, y)
         for item_entry in entities.get("RandomBox", []):
             # RandomBox entries may include an item value
             if len(item_entry) >= 3:
                 x, y, item = item_entry[0], item_entry[1], item_entry[2]
-                self.addRandomBox(x, y, item)
+                self.indexSpawn(self.addRandomBox, x, x, y, item)
 
         # boss spawn (optional) lives under objects
         objects = data.get("level", {}).get("objects", {}) or {}
-        print("loadEntities: object keys:", list(objects.keys()))
+        log.debug("loadEntities: object keys: {}", list(objects.keys()))
         boss_spawns = objects.get("boss_spawn", [])
         if boss_spawns:
-            print(f"Found boss_spawn entries: {boss_spawns}")
+            log.debug("Found boss_spawn entries: {}", boss_spawns)
         for x, y in boss_spawns:
-            print(f"Adding boss at {x},{y}")
-            self.addBoss(x, y)
+            self.indexSpawn(self.addBoss, x, x, y)
+
+    def indexTiles(self, place, x, width, *args):
+        # remember a tile placement in every segment it covers
+        for segment in range(x // self.chunkWidth, (x + width - 1) // self.chunkWidth + 1):
+            if 0 <= segment < len(self.segmentTiles):
+                self.segmentTiles[segment].append((place, args))
+
+    def indexSpawn(self, add, x, *args):
+        segment = min(max(x // self.chunkWidth, 0), len(self.pendingSpawns) - 1)
+        self.pendingSpawns[segment].append((add, args))
 
     def addBoss(self, x, y):
         try:
             from entities.Boss import Boss
 
+            log.debug("Adding boss at {},{}", x, y)
             b = Boss(self.screen, self.sprites.spriteCollection, x, y, self, self.sound)
-            self.entityList.append(b)
+            # each boss adds room for every fire it can have in flight,
+            # plus the one it launches on the step an old one runs out
+            self.projectiles.reserve(self.projectiles.lifetime // b.fireCooldown + 1)
+            self.addEntity(b)
+            return b
         except Exception:
             return
 
-    def loadLayers(self, data):
-        layers = []
-        for x in range(*data["level"]["layers"]["sky"]["x"]):
-            layers.append(
-                (
-                        [
-                            Tile(self.sprites.spriteCollection.get("sky"), None)
-                            for y in range(*data["level"]["layers"]["sky"]["y"])
-                        ]
-                        + [
-                            Tile(
-                                self.sprites.spriteCollection.get("ground"),
-                                pygame.Rect(x * 32, (y - 1) * 32, 32, 32),
-                            )
-                            for y in range(*data["level"]["layers"]["ground"]["y"])
-                        ]
-                )
-            )
-        self.level = list(map(list, zip(*layers)))
+    def streamSegments(self, left):
+        # build the segments under the camera (left is its left edge in level
+        # pixels) and drop the ones that have scrolled out of reach
+        chunkSize = self.chunkWidth * 32
+        first = max(left // chunkSize - self.streamMargin, 0)
+        last = min(
+            (left + self.screen.get_width()) // chunkSize + self.streamMargin,
+            len(self.chunks) - 1,
+        )
+        for segment in sorted(self.loadedSegments):
+            if not first <= segment <= last:
+                self.dropSegment(segment)
+        for segment in range(first, last + 1):
+            if segment not in self.loadedSegments:
+                self.buildSegment(segment)
+        # entities that walked off into a segment that is not built go too
+        for entity in self.entityList:
+            segment = entity.rect.centerx // chunkSize
+            if entity.alive is not None and 0 <= segment < len(self.chunks):
+                if not first <= segment <= last:
+                    self.parkEntity(entity, segment)
 
-    def loadObjects(self, data):
-        for x, y in data["level"]["objects"].get("bush", []):
-            self.addBushSprite(x, y)
-        for x, y in data["level"]["objects"].get("cloud", []):
-            self.addCloudSprite(x, y)
-        for x, y, z in data["level"]["objects"].get("pipe", []):
-            self.addPipeSprite(x, y, z)
-        for x, y in data["level"]["objects"].get("sky", []):
-            self.level[y][x] = Tile(self.sprites.spriteCollection.get("sky"), None)
-        for x, y in data["level"]["objects"].get("ground", []):
-            self.level[y][x] = Tile(
-                self.sprites.spriteCollection.get("ground"),
-                pygame.Rect(x * 32, y * 32, 32, 32),
-            )
+    def buildSegment(self, segment):
+        self.building = range(
+            segment * self.chunkWidth,
+            min((segment + 1) * self.chunkWidth, len(self.level[0])),
+        )
+        sky = Tile(self.sprites.spriteCollection.get("sky"), None)
+        ground = self.sprites.spriteCollection.get("ground")
+        for x in self.building:
+            for y in range(len(self.skyRows)):
+                self.level[y][x] = sky
+            for y, groundY in enumerate(self.groundRows, len(self.skyRows)):
+                self.level[y][x] = Tile(ground, pygame.Rect(x * 32, (groundY - 1) * 32, 32, 32))
+        for place, args in self.segmentTiles[segment]:
+            place(*args)
+        self.buildSolidity()
+        self.collectAnimatedTiles(segment)
+        # level file entities are made the first time their segment is built;
+        # after that the segment gets back the very entities parked in it
+        for add, args in self.pendingSpawns[segment]:
+            add(*args)
+        self.pendingSpawns[segment] = []
+        for entity, alive in self.parkedEntities[segment]:
+            entity.alive = alive
+            self.addEntity(entity)
+        self.parkedEntities[segment] = []
+        self.building = range(0)
+        self.loadedSegments.add(segment)
+
+    def dropSegment(self, segment):
+        for x in range(segment * self.chunkWidth, (segment + 1) * self.chunkWidth):
+            for row in self.level:
+                if x < len(row):
+                    row[x] = None
+        self.chunks[segment] = None
+        self.animatedTiles[segment] = None
+        self.loadedSegments.discard(segment)
+
+    def parkEntity(self, entity, segment):
+        # kept as it is, used blocks, kicked shells and all, until the segment
+        # it is in is built again
+        self.parkedEntities[segment].append((entity, entity.alive))
+        self.removeEntity(entity)
+
+    def setTile(self, x, y, tile):
+        # writes outside the segment being built are left to the other
+        # segment's own build
+        if x in self.building and 0 <= y < len(self.level):
+            self.level[y][x] = tile
+
+    def buildSolidity(self):
+        # compact [y][x] collision grid for Collider: 0 is passable, otherwise
+        # the tile's top edge sits (value - 1) pixels above its cell; dropped
+        # segments keep theirs, it is a few bytes per column
+        for y, row in enumerate(self.level):
+            for x in self.building:
+                tile = row[x]
+                self.solidity[y][x] = 0 if tile.rect is None else y * 32 - tile.rect.top + 1
+        self.projectiles.tilesChanged()
+
+    def collectAnimatedTiles(self, segment):
+        # animated tiles are left out of the chunk and drawn on top every frame
+        animatedTiles = []
+        for y, row in enumerate(self.level):
+            for x in self.building:
+                sprite = row[x].sprite
+                if sprite is not None and sprite.animation is not None:
+                    animatedTiles.append((x, y, sprite))
+        self.animatedTiles[segment] = animatedTiles
+
+    def buildChunk(self, segment):
+        # pre-render the static tiles of a segment into one surface so
+        # drawLevel only has to blit the few chunks under the camera; done by
+        # drawChunks the first time a built segment is in view, so the logic
+        # step never touches a surface
+        sky = self.sprites.spriteCollection.get("sky")
+        chunkX = segment * self.chunkWidth
+        chunk = pygame.Surface((self.chunkWidth * 32, len(self.level) * 32))
+        for y, row in enumerate(self.level):
+            for x in range(chunkX, min(chunkX + self.chunkWidth, len(row))):
+                sprite = row[x].sprite
+                pos = ((x - chunkX) * 32, y * 32)
+                if sprite is None or sprite.redrawBackground or sprite.animation is not None:
+                    chunk.blit(sky.image, pos)
+                if sprite is not None and sprite.animation is None:
+                    chunk.blit(sprite.image, pos)
+        self.chunks[segment] = chunk
+
+    def drawChunks(self, camera):
+        chunkSize = self.chunkWidth * 32
+        left = int(-camera.x)
+        first = max(left // chunkSize, 0)
+        last = min((left + self.screen.get_width()) // chunkSize, len(self.chunks) - 1)
+        for i in range(first, last + 1):
+            if self.chunks[i] is None and i in self.loadedSegments:
+                self.buildChunk(i)
+            if self.chunks[i] is not None:
+                self.screen.blit(self.chunks[i], (i * chunkSize + camera.x, 0))
+
+    def drawAnimatedTiles(self, camera):
+        left = -int(camera.pos.x + 1)
+        right = 20 - int(camera.pos.x - 1)
+        for segment in range(
+            max(left // self.chunkWidth, 0),
+            min(right // self.chunkWidth, len(self.animatedTiles) - 1) + 1,
+        ):
+            for x, y, sprite in self.animatedTiles[segment] or ():
+                if left <= x < right:
+                    sprite.drawSprite(x + camera.pos.x, y, self.screen)
+
+    def rebuildEntityGrid(self):
+        # broadphase for entity collisions: bucket entities by the 32px columns
+        # their rect spans, remembering list order so queries stay deterministic
+        self.entityGrid = {}
+        for index, entity in enumerate(self.entityList):
+            for column in range(entity.rect.left // 32, (entity.rect.right - 1) // 32 + 1):
+                self.entityGrid.setdefault(column, []).append((index, entity))
+
+    def nearbyEntities(self, rect):
+        # candidates within one column of rect; the margin covers movement
+        # since the grid was rebuilt at the start of updateEntities
+        found = {}
+        for column in range(rect.left // 32 - 1, (rect.right - 1) // 32 + 2):
+            for index, entity in self.entityGrid.get(column, ()):
+                if entity.alive is not None:
+                    found[index] = entity
+        return [found[index] for index in sorted(found)]
 
     def updateEntities(self, cam):
+        start = profiler.begin()
+        clock.tick()
+        self.streamSegments(int(-cam.x))
+        self.rebuildEntityGrid()
+        # entities out of range sleep: they keep their state and carry on
+        # from there once the camera comes close again
+        left = int(-cam.x) - self.activationMargin
+        right = int(-cam.x) + self.screen.get_width() + self.activationMargin
+        awake = []
         for entity in self.entityList:
+            if entity.alive is None:
+                continue
+            entity.savePosition()
+            if not entity.sleepOffscreen or left < entity.rect.centerx < right:
+                awake.append(entity)
+        if self.walkerPhysics is not None:
+            self.walkerPhysics.step(awake)
+        self.projectiles.update()
+        for entity in awake:
+            if entity.alive is None:
+                continue
             entity.update(cam)
             if entity.alive is None:
-                self.entityList.remove(entity)
+                self.despawned = True
+        self.flushEntities()
+        profiler.end("entities", start)
+
+    def drawEntities(self, cam, alpha=1.0):
+        left = int(-cam.x) - 32
+        right = int(-cam.x) + self.screen.get_width() + 32
+        for entity in self.entityList:
+            if entity.alive is not None and left < entity.rect.centerx < right:
+                # rects are only moved to the interpolated spot while drawing
+                x, y = entity.rect.x, entity.rect.y
+                entity.rect.topleft = entity.renderPosition(alpha)
+                entity.draw(cam)
+                entity.rect.topleft = (x, y)
 
-    def drawLevel(self, camera):
+    def addEntity(self, entity):
+        # spawns wait in spawnQueue until flushEntities so entityList never
+        # changes while updateEntities is iterating over it
+        self.spawnQueue.append(entity)
+        return entity
+
+    def removeEntity(self, entity):
+        # tombstone the entity; it is skipped from now on and dropped by flushEntities
+        entity.alive = None
+        self.despawned = True
+
+    def flushEntities(self):
+        if self.despawned:
+            self.entityList = [entity for entity in self.entityList if entity.alive is not None]
+            self.despawned = False
+        if self.spawnQueue:
+            self.entityList.extend(self.spawnQueue)
+            self.spawnQueue = []
+
+    def drawLevel(self, camera, alpha=1.0):
         try:
-            for y in range(0, 15):
-                for x in range(0 - int(camera.pos.x + 1), 20 - int(camera.pos.x - 1)):
-                    if self.level[y][x].sprite is not None:
-                        if self.level[y][x].sprite.redrawBackground:
-                            self.screen.blit(
-                                self.sprites.spriteCollection.get("sky").image,
-                                ((x + camera.pos.x) * 32, y * 32),
-                            )
-                        self.level[y][x].sprite.drawSprite(
-                            x + camera.pos.x, y, self.screen
-                        )
-            self.updateEntities(camera)
-            # Debug: draw projectile markers for visibility (small circles at projectile screen x)
-            try:
-                proj_count = 0
-                for ent in self.entityList:
-                    if ent.__class__.__name__ == 'BossFire':
-                        proj_count += 1
-                        try:
-                            px = int(ent.rect.x + camera.x)
-                            py = 16
-                            pygame.draw.circle(self.screen, (255, 240, 50), (px, py), 5)
-                        except Exception:
-                            pass
-                # draw projectile count using dashboard if available
-                try:
-                    self.dashboard.drawText(f"Bullets: {proj_count}", 10, 16, 8)
-                except Exception:
-                    pass
-            except Exception:
-                pass
+            start = profiler.begin()
+            self.drawChunks(camera)
+            self.drawAnimatedTiles(camera)
+            profiler.end("tiles", start)
+            self.drawEntities(camera, alpha)
+            self.projectiles.draw(camera, alpha)
         except IndexError:
             return
 
     def addCloudSprite(self, x, y):
-        try:
-            for yOff in range(0, 2):
-                for xOff in range(0, 3):
-                    self.level[y + yOff][x + xOff] = Tile(
-                        self.sprites.spriteCollection.get("cloud{}_{}".format(yOff + 1, xOff + 1)), None, )
-        except IndexError:
-            return
+        for yOff in range(0, 2):
+            for xOff in range(0, 3):
+                self.setTile(x + xOff, y + yOff, Tile(
+                    self.sprites.spriteCollection.get("cloud{}_{}".format(yOff + 1, xOff + 1)), None, ))
 
     def addPipeSprite(self, x, y, length=2):
-        try:
-            # add pipe head
-            self.level[y][x] = Tile(
-                self.sprites.spriteCollection.get("pipeL"),
-                pygame.Rect(x * 32, y * 32, 32, 32),
-            )
-            self.level[y][x + 1] = Tile(
-                self.sprites.spriteCollection.get("pipeR"),
-                pygame.Rect((x + 1) * 32, y * 32, 32, 32),
-            )
-            # add pipe body
-            for i in range(1, length + 20):
-                self.level[y + i][x] = Tile(
-                    self.sprites.spriteCollection.get("pipe2L"),
-                    pygame.Rect(x * 32, (y + i) * 32, 32, 32),
-                )
-                self.level[y + i][x + 1] = Tile(
-                    self.sprites.spriteCollection.get("pipe2R"),
-                    pygame.Rect((x + 1) * 32, (y + i) * 32, 32, 32),
-                )
-        except IndexError:
-            return
+        # add pipe head
+        self.setTile(x, y, Tile(
+            self.sprites.spriteCollection.get("pipeL"),
+            pygame.Rect(x * 32, y * 32, 32, 32),
+        ))
+        self.setTile(x + 1, y, Tile(
+            self.sprites.spriteCollection.get("pipeR"),
+            pygame.Rect((x + 1) * 32, y * 32, 32, 32),
+        ))
+        # add pipe body
+        for i in range(1, min(length + 20, len(self.level) - y)):
+            self.setTile(x, y + i, Tile(
+                self.sprites.spriteCollection.get("pipe2L"),
+                pygame.Rect(x * 32, (y + i) * 32, 32, 32),
+            ))
+            self.setTile(x + 1, y + i, Tile(
+                self.sprites.spriteCollection.get("pipe2R"),
+                pygame.Rect((x + 1) * 32, (y + i) * 32, 32, 32),
+            ))
 
     def addBushSprite(self, x, y):
-        try:
-            self.level[y][x] = Tile(self.sprites.spriteCollection.get("bush_1"), None)
-            self.level[y][x + 1] = Tile(
-                self.sprites.spriteCollection.get("bush_2"), None
-            )
-            self.level[y][x + 2] = Tile(
-                self.sprites.spriteCollection.get("bush_3"), None
-            )
-        except IndexError:
-            return
+        self.setTile(x, y, Tile(self.sprites.spriteCollection.get("bush_1"), None))
+        self.setTile(x + 1, y, Tile(
+            self.sprites.spriteCollection.get("bush_2"), None
+        ))
+        self.setTile(x + 2, y, Tile(
+            self.sprites.spriteCollection.get("bush_3"), None
+        ))
+
+    def addSkyTile(self, x, y):
+        self.setTile(x, y, Tile(self.sprites.spriteCollection.get("sky"), None))
+
+    def addGroundTile(self, x, y):
+        self.setTile(x, y, Tile(
+            self.sprites.spriteCollection.get("ground"),
+            pygame.Rect(x * 32, y * 32, 32, 32),
+        ))
+
+    def addBlockTile(self, x, y):
+        self.setTile(x, y, Tile(None, pygame.Rect(x * 32, y * 32 - 1, 32, 32)))
 
     def addCoinBox(self, x, y):
-        self.level[y][x] = Tile(None, pygame.Rect(x * 32, y * 32 - 1, 32, 32))
-        self.entityList.append(
+        return self.addEntity(
             CoinBox(
                 self.screen,
                 self.sprites.spriteCollection,
@@ -213,8 +454,7 @@ class Level:
         )
 
     def addRandomBox(self, x, y, item):
-        self.level[y][x] = Tile(None, pygame.Rect(x * 32, y * 32 - 1, 32, 32))
-        self.entityList.append(
+        return self.addEntity(
             RandomBox(
                 self.screen,
                 self.sprites.spriteCollection,
@@ -228,11 +468,10 @@ class Level:
         )
 
     def addCoin(self, x, y):
-        self.entityList.append(Coin(self.screen, self.sprites.spriteCollection, x, y))
+        return self.addEntity(Coin(self.screen, self.sprites.spriteCollection, x, y))
 
     def addCoinBrick(self, x, y):
-        self.level[y][x] = Tile(None, pygame.Rect(x * 32, y * 32 - 1, 32, 32))
-        self.entityList.append(
+        return self.addEntity(
             CoinBrick(
                 self.screen,
                 self.sprites.spriteCollection,
@@ -244,16 +483,16 @@ class Level:
         )
 
     def addGoomba(self, x, y):
-        self.entityList.append(
+        return self.addEntity(
             Goomba(self.screen, self.sprites.spriteCollection, x, y, self, self.sound)
         )
 
     def addKoopa(self, x, y):
-        self.entityList.append(
+        return self.addEntity(
             Koopa(self.screen, self.sprites.spriteCollection, x, y, self, self.sound)
         )
 
     def addRedMushroom(self, x, y):
-        self.entityList.append(
+        return self.addEntity(
             RedMushroom(self.screen, self.sprites.spriteCollection, x, y, self, self.sound)
         )
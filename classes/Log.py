@@ -0,0 +1,34 @@
+import time
+
+
+class RateLimitedLog:
+    # stdout logging that cannot flood the terminal: each message format
+    # prints at most burst times per interval seconds, the rest is counted
+    # and summed up when the format shows up again. debug() messages are
+    # dropped before formatting unless verbose (on with the debug overlay)
+    def __init__(self, interval=1.0, burst=5):
+        self.interval = interval
+        self.burst = burst
+        self.verbose = False
+        self.windows = {}
+
+    def debug(self, message, *args):
+        if self.verbose:
+            self.info(message, *args)
+
+    def info(self, message, *args):
+        now = time.perf_counter()
+        window = self.windows.get(message)
+        if window is None or now - window[0] >= self.interval:
+            if window is not None and window[2]:
+                print("... {:d} more of: {}".format(window[2], message))
+            window = [now, 0, 0]
+            self.windows[message] = window
+        if window[1] < self.burst:
+            window[1] += 1
+            print(message.format(*args))
+        else:
+            window[2] += 1
+
+
+log = RateLimitedLog()
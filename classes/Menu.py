@@ -45,6 +45,7 @@ class Menu:
             return
 
         self.drawMenuBackground()
+        self.dashboard.draw()
         self.dashboard.update()
 
         if not self.inSettings:
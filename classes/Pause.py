@@ -11,7 +11,8 @@ class Pause:
         self.dashboard = dashboard
         self.state = 0
         self.spritesheet = Spritesheet("./img/title_screen.png")
-        self.pause_srfc = GaussianBlur().filter(self.screen, 0, 0, 640, 480)
+        # blurred when the game is paused, see createBackgroundBlur
+        self.pause_srfc = None
         self.dot = self.spritesheet.image_at(
             0, 150, 2, colorkey=[255, 0, 220], ignoreTileSize=True
         )
@@ -20,7 +21,8 @@ class Pause:
         )
 
     def update(self):
-        self.screen.blit(self.pause_srfc, (0, 0))
+        if self.pause_srfc is not None:
+            self.screen.blit(self.pause_srfc, (0, 0))
         self.dashboard.drawText("PAUSED", 120, 160, 68)
         self.dashboard.drawText("CONTINUE", 150, 280, 32)
         self.dashboard.drawText("BACK TO MENU", 150, 320, 32)
@@ -56,4 +58,5 @@ class Pause:
                         self.state += 1
 
     def createBackgroundBlur(self):
-        self.pause_srfc = GaussianBlur().filter(self.screen, 0, 0, 640, 480)
+        width, height = self.screen.get_size()
+        self.pause_srfc = GaussianBlur().filter(self.screen, 0, 0, width, height)
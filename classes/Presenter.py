@@ -0,0 +1,47 @@
+import pygame
+
+
+class Presenter:
+    # gets the 640x480 logical surface onto the window, in a mode picked once
+    # at startup:
+    #   stretch  fill the whole window, whatever its aspect ratio
+    #   fit      the largest size with the logical aspect ratio, letterboxed
+    #   integer  the largest whole multiple of the logical size, letterboxed
+    #   sdl      SDL's renderer scales the window (pygame.SCALED), no copy at all
+    modes = ["stretch", "fit", "integer", "sdl"]
+
+    def __init__(self):
+        self.surface = None
+        self.target = None
+
+    def setMode(self, mode, logicalSize, windowSize):
+        if mode == "sdl":
+            self.surface = pygame.display.set_mode(logicalSize, pygame.SCALED)
+            self.target = None
+            return self.surface
+        screen = pygame.display.set_mode(windowSize)
+        screen.fill((0, 0, 0))
+        self.surface = pygame.Surface(logicalSize).convert()
+        rect = self.targetRect(mode, logicalSize, windowSize)
+        # scaled straight into this part of the window, no surface per frame
+        self.target = screen.subsurface(rect)
+        return self.surface
+
+    def targetRect(self, mode, logicalSize, windowSize):
+        if mode == "stretch":
+            return pygame.Rect((0, 0), windowSize)
+        width, height = logicalSize
+        scale = min(windowSize[0] / float(width), windowSize[1] / float(height))
+        if mode == "integer":
+            scale = max(int(scale), 1)
+        rect = pygame.Rect(0, 0, int(width * scale), int(height * scale))
+        rect.center = windowSize[0] // 2, windowSize[1] // 2
+        return rect.clip(pygame.Rect((0, 0), windowSize))
+
+    def present(self):
+        if self.target is not None:
+            pygame.transform.scale(self.surface, self.target.get_size(), self.target)
+        pygame.display.update()
+
+
+presenter = Presenter()
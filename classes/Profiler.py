@@ -0,0 +1,125 @@
+import collections
+import csv
+import time
+
+import pygame
+
+
+class Profiler:
+    # milliseconds per frame spent in named sections of the game loop; timing
+    # is only collected while enabled (F9), F10 dumps the kept frames as CSV
+    def __init__(self, history=3600, graphSize=(240, 80)):
+        self.enabled = False
+        # stacked in the graph, bottom to top; collision is a part of
+        # entities and mario, so it only shows up in the legend and the CSV
+        self.sections = ["tiles", "entities", "mario", "hud", "present"]
+        self.colors = {
+            "tiles": (80, 160, 255),
+            "entities": (255, 160, 40),
+            "mario": (230, 60, 60),
+            "hud": (200, 80, 220),
+            "present": (60, 200, 90),
+            "other": (140, 140, 140),
+        }
+        self.columns = self.sections + ["collision", "other"]
+        self.current = {}
+        self.frames = collections.deque(maxlen=history)
+        # counts every profiled frame; len(frames) stops at the history size
+        self.frameCount = 0
+        self.lastFrame = time.perf_counter()
+        self.graphSize = graphSize
+        self.graph = None
+        self.scale = 3  # pixels per millisecond
+        self.font = None
+        self.legend = []
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.current = {}
+        self.lastFrame = time.perf_counter()
+
+    def begin(self):
+        if self.enabled:
+            return time.perf_counter()
+        return None
+
+    def end(self, name, start):
+        if start is not None and self.enabled:
+            ms = (time.perf_counter() - start) * 1000
+            self.current[name] = self.current.get(name, 0.0) + ms
+
+    def beginFrame(self):
+        self.lastFrame = time.perf_counter()
+
+    def endFrame(self):
+        now = time.perf_counter()
+        if self.enabled:
+            frame = self.current
+            frame["frame"] = (now - self.lastFrame) * 1000
+            frame["other"] = max(
+                frame["frame"] - sum(frame.get(name, 0.0) for name in self.sections), 0.0
+            )
+            self.frames.append(frame)
+            self.frameCount += 1
+            self.drawColumn(frame)
+            if self.frameCount % 30 == 0:
+                self.legend = []
+        self.current = {}
+
+    def drawColumn(self, frame):
+        # the graph scrolls left one pixel per frame, so each frame costs one column
+        width, height = self.graphSize
+        if self.graph is None:
+            self.graph = pygame.Surface(self.graphSize)
+            self.graph.fill((0, 0, 0))
+        self.graph.scroll(-1, 0)
+        x = width - 1
+        pygame.draw.line(self.graph, (0, 0, 0), (x, 0), (x, height - 1))
+        y = height
+        for name in self.sections + ["other"]:
+            h = int(frame.get(name, 0.0) * self.scale)
+            if h > 0:
+                pygame.draw.line(self.graph, self.colors[name], (x, y - 1), (x, y - h))
+            y -= h
+        budget = height - int(1000.0 / 60 * self.scale)
+        self.graph.set_at((x, budget), (255, 255, 255))
+
+    def draw(self, surface):
+        if not self.enabled or self.graph is None:
+            return
+        x, y = 10, surface.get_height() - self.graphSize[1] - 10
+        surface.blit(self.graph, (x, y))
+        if not self.legend:
+            self.renderLegend()
+        x += self.graphSize[0]
+        y = surface.get_height() - 10 - len(self.legend) * 11
+        surface.fill((0, 0, 0), (x, y, 110, len(self.legend) * 11))
+        for i, label in enumerate(self.legend):
+            surface.blit(label, (x + 4, y + i * 11))
+
+    def renderLegend(self):
+        if self.font is None:
+            self.font = pygame.font.Font(None, 16)
+        recent = list(self.frames)[-60:]
+        for name in ["frame"] + self.columns:
+            ms = sum(frame.get(name, 0.0) for frame in recent) / max(len(recent), 1)
+            color = self.colors.get(name, (255, 255, 255))
+            self.legend.append(
+                self.font.render("{} {:.2f} ms".format(name, ms), False, color)
+            )
+
+    def dumpCsv(self, path=None):
+        if path is None:
+            path = time.strftime("profile-%Y%m%d-%H%M%S.csv")
+        with open(path, "w", newline="") as csvFile:
+            writer = csv.writer(csvFile)
+            writer.writerow(["frame", "total"] + self.columns)
+            for i, frame in enumerate(self.frames):
+                writer.writerow(
+                    [i, "{:.3f}".format(frame["frame"])]
+                    + ["{:.3f}".format(frame.get(name, 0.0)) for name in self.columns]
+                )
+        return path
+
+
+profiler = Profiler()
@@ -0,0 +1,118 @@
+from entities.BossFire import BossFire
+
+
+class Projectiles:
+    # every BossFire of the level lives here instead of in entityList: fired
+    # ones are moved and checked in one loop per step, spent ones go back on
+    # the free list to be launched again, so a boss fight allocates nothing
+    def __init__(self, level):
+        self.levelObj = level
+        self.active = []
+        self.free = []
+        # fires are size x size pixels (see BossFire)
+        self.size = 16
+        self.lifetime = 300
+        self.hitGrid = None
+        self.solidBytes = bytes([0] + [1] * 255)
+
+    def reserve(self, count):
+        # count more fires on top of the ones already made
+        for _ in range(count):
+            self.free.append(BossFire(self.levelObj.screen, self.levelObj))
+
+    def fire(self, x, y, vx, vy):
+        if not self.free:
+            self.reserve(len(self.active) // 2 + 1)
+        projectile = self.free.pop()
+        projectile.launch(x, y, vx, vy)
+        self.active.append(projectile)
+        return projectile
+
+    def tilesChanged(self):
+        # Level.buildSolidity changed the grid; rebuilt when next needed
+        self.hitGrid = None
+
+    def buildHitGrid(self):
+        # a fire hits the tiles under it, counting the ones just past its right
+        # and bottom edge. Being half a tile in size, which tiles those are
+        # depends only on the half-tile square its top left corner is in, so
+        # this grid has a byte per such square saying whether a fire there
+        # hits; the first row and column are the squares just outside the
+        # level's top and left edge. Rows are or-ed together whole, as ints
+        rows = []
+        for row in self.levelObj.solidity:
+            solid = row.translate(self.solidBytes)
+            halves = bytearray(2 * len(solid))
+            halves[0::2] = solid
+            halves[1::2] = solid
+            rows.append(self.orBytes(b"\0" + halves, halves + b"\0"))
+        halves = [row for row in rows for _ in range(2)]
+        empty = bytes(len(rows[0])) if rows else b""
+        self.hitGrid = [
+            self.orBytes(above, below)
+            for above, below in zip([empty] + halves, halves + [empty])
+        ]
+
+    def orBytes(self, first, second):
+        return (
+            int.from_bytes(first, "big") | int.from_bytes(second, "big")
+        ).to_bytes(len(first), "big")
+
+    def update(self):
+        if not self.active:
+            return
+        if self.hitGrid is None:
+            self.buildHitGrid()
+        grid = self.hitGrid
+        rows = len(grid)
+        columns = len(grid[0]) if rows else 0
+        size = self.size
+        active = []
+        for projectile in self.active:
+            rect = projectile.rect
+            x = rect.x
+            y = rect.y
+            projectile.previousPos = (x, y)
+            dx = int(projectile.vx)
+            dy = int(projectile.vy)
+            rect.x = x + dx
+            rect.y = y + dy
+            projectile.timer += 1
+            # remove after some time or on hitting a solid tile; fires never
+            # reached Mario before the pool, so they still pass through him
+            if projectile.timer > self.lifetime:
+                hit = True
+            elif -size < dx < size and -size < dy < size:
+                row = (y + dy) // size + 1
+                column = (x + dx) // size + 1
+                hit = 0 <= row < rows and 0 <= column < columns and grid[row][column]
+            else:
+                hit = self.sweepHits(x, y, dx, dy)
+            if hit:
+                projectile.alive = None
+                self.free.append(projectile)
+            else:
+                active.append(projectile)
+        self.active = active
+
+    def sweepHits(self, x, y, dx, dy):
+        # a move of a fire's size or more is checked at points less than that
+        # apart, so a fast shot cannot skip a tile on the way
+        grid = self.hitGrid
+        steps = max(abs(dx), abs(dy)) // self.size + 1
+        for step in range(1, steps + 1):
+            row = (y + dy * step // steps) // self.size + 1
+            column = (x + dx * step // steps) // self.size + 1
+            if 0 <= row < len(grid) and 0 <= column < len(grid[row]) and grid[row][column]:
+                return True
+        return False
+
+    def draw(self, camera, alpha=1.0):
+        left = int(-camera.x) - 32
+        right = int(-camera.x) + self.levelObj.screen.get_width() + 32
+        for projectile in self.active:
+            if left < projectile.rect.centerx < right:
+                x, y = projectile.rect.x, projectile.rect.y
+                projectile.rect.topleft = projectile.renderPosition(alpha)
+                projectile.draw(camera)
+                projectile.rect.topleft = (x, y)
@@ -0,0 +1,104 @@
+import os
+import struct
+
+from classes.Input import InputState
+
+MAGIC = b"MREC"
+VERSION = 1
+HEADER = struct.Struct("<4sHIH")
+MOUSE = struct.Struct("<hh")
+
+# one flag byte per logic step, followed by the mouse position when clicked
+RIGHT = 1
+LEFT = 2
+JUMP = 4
+BOOST = 8
+LEFT_CLICK = 16
+RIGHT_CLICK = 32
+# the F2/F3 debug keys, which move Mario and so have to replay too
+TO_BOSS = 64
+BOSS_LEVEL = 128
+
+
+def freeRecordingPath(path):
+    # every game played with --record gets a file of its own: run.rec, then
+    # run-2.rec, run-3.rec, ... so nothing already recorded is overwritten
+    base, extension = os.path.splitext(path)
+    number = 1
+    while os.path.exists(path):
+        number += 1
+        path = "{}-{:d}{}".format(base, number, extension)
+    return path
+
+
+class InputRecorder:
+    # writes the level name, the level's random seed and then every InputState
+    # the player produced, one per logic step
+    def __init__(self, path, levelName, seed):
+        self.path = path
+        self.frames = 0
+        self.file = open(path, "wb")
+        name = levelName.encode("utf-8")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, len(name)))
+        self.file.write(name)
+
+    def record(self, state):
+        flags = 0
+        if state.direction == 1:
+            flags |= RIGHT
+        elif state.direction == -1:
+            flags |= LEFT
+        if state.jumping:
+            flags |= JUMP
+        if state.boost:
+            flags |= BOOST
+        if state.leftClick:
+            flags |= LEFT_CLICK
+        if state.rightClick:
+            flags |= RIGHT_CLICK
+        if state.toBoss:
+            flags |= TO_BOSS
+        if state.bossLevel:
+            flags |= BOSS_LEVEL
+        self.file.write(bytes([flags]))
+        if state.leftClick or state.rightClick:
+            self.file.write(MOUSE.pack(state.mouseX, state.mouseY))
+        self.frames += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+class InputReplay:
+    # feeds a recording back one InputState per logic step
+    def __init__(self, path):
+        with open(path, "rb") as recording:
+            self.data = recording.read()
+        magic, version, self.seed, nameLength = HEADER.unpack_from(self.data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("{} is not an input recording".format(path))
+        start = HEADER.size
+        self.levelName = self.data[start:start + nameLength].decode("utf-8")
+        self.offset = start + nameLength
+        self.frames = 0
+
+    def next(self):
+        if self.offset >= len(self.data):
+            return None
+        flags = self.data[self.offset]
+        self.offset += 1
+        state = InputState(
+            1 if flags & RIGHT else -1 if flags & LEFT else 0,
+            bool(flags & JUMP),
+            bool(flags & BOOST),
+            bool(flags & LEFT_CLICK),
+            bool(flags & RIGHT_CLICK),
+            toBoss=bool(flags & TO_BOSS),
+            bossLevel=bool(flags & BOSS_LEVEL),
+        )
+        if state.leftClick or state.rightClick:
+            state.mouseX, state.mouseY = MOUSE.unpack_from(self.data, self.offset)
+            self.offset += MOUSE.size
+        self.frames += 1
+        return state
@@ -0,0 +1,43 @@
+import pygame
+
+from classes.Dashboard import Dashboard
+from classes.Level import Level
+from classes.Sound import Sound
+from entities.Mario import Mario
+
+
+class Simulation:
+    # one level with Mario, stepped through separate update and draw passes;
+    # without a video mode only update() is meant to be called, which never
+    # touches a surface
+    def __init__(self, levelName, screen=None, seed=0):
+        if screen is None:
+            screen = pygame.Surface((640, 480))
+        self.screen = screen
+        self.dashboard = Dashboard("./img/font.png", 8, screen)
+        self.sound = Sound()
+        self.level = Level(screen, self.sound, self.dashboard, seed)
+        self.level.loadLevel(levelName)
+        self.dashboard.state = "start"
+        self.dashboard.levelName = levelName.split("Level")[-1]
+        self.mario = Mario(0, 0, self.level, screen, self.dashboard, self.sound)
+        self.level.player = self.mario
+        self.frame = 0
+
+    def update(self):
+        self.level.updateEntities(self.mario.camera)
+        self.dashboard.update()
+        self.mario.update()
+        self.frame += 1
+
+    def draw(self):
+        self.level.drawLevel(self.mario.camera)
+        self.dashboard.draw()
+        self.mario.draw()
+
+    def run(self, frames):
+        for _ in range(frames):
+            if self.mario.restart:
+                break
+            self.update()
+        return self.frame
@@ -1,4 +1,9 @@
+from classes.Animation import clock
+
+
 class Sprite:
+    __slots__ = ("image", "colliding", "animation", "redrawBackground")
+
     def __init__(self, image, colliding, animation=None, redrawBackground=False):
         self.image = image
         self.colliding = colliding
@@ -10,5 +15,4 @@ class Sprite:
         if self.animation is None:
             screen.blit(self.image, dimensions)
         else:
-            self.animation.update()
-            screen.blit(self.animation.image, dimensions)
+            screen.blit(clock.image(self.animation), dimensions)
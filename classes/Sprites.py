@@ -1,23 +1,35 @@
 import json
 
 from classes.Animation import Animation
+from classes.AssetPack import AssetPack
 from classes.Sprite import Sprite
 from classes.Spritesheet import Spritesheet
 
 
 class Sprites:
+    # process-wide registry: the sprite files are parsed and sliced on first
+    # access and the resulting collection is shared by every Sprites()
+    collection = None
+
     def __init__(self):
-        self.spriteCollection = self.loadSprites(
-            [
-                "./sprites/Mario.json",
-                "./sprites/Goomba.json",
-                "./sprites/Koopa.json",
-                "./sprites/Animations.json",
-                "./sprites/BackgroundSprites.json",
-                "./sprites/ItemAnimations.json",
-                "./sprites/RedMushroom.json"
-            ]
-        )
+        self.urlList = [
+            "./sprites/Mario.json",
+            "./sprites/Goomba.json",
+            "./sprites/Koopa.json",
+            "./sprites/Animations.json",
+            "./sprites/BackgroundSprites.json",
+            "./sprites/ItemAnimations.json",
+            "./sprites/RedMushroom.json"
+        ]
+
+    @property
+    def spriteCollection(self):
+        if Sprites.collection is None:
+            # prefer the prebuilt pack from pack.py, slice the sheets otherwise
+            Sprites.collection = AssetPack().spriteCollection()
+            if Sprites.collection is None:
+                Sprites.collection = self.loadSprites(self.urlList)
+        return Sprites.collection
 
     def loadSprites(self, urlList):
         resDict = {}
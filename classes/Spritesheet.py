@@ -1,16 +1,36 @@
 import pygame
 
 
+def convertSurface(image):
+    # match the display's pixel format so blits take the fast path; before
+    # set_mode there is nothing to convert to and the image is kept as is
+    if pygame.display.get_surface() is None:
+        return image
+    if image.get_flags() & pygame.SRCALPHA:
+        return image.convert_alpha()
+    colorkey = image.get_colorkey()
+    image = image.convert()
+    if colorkey is not None:
+        image.set_colorkey(colorkey, pygame.RLEACCEL)
+    return image
+
+
 class Spritesheet(object):
+    # decoded sheets shared by every Spritesheet, keyed by filename
+    sheets = {}
+
     def __init__(self, filename):
+        self.sheet = Spritesheet.sheets.get(filename)
+        if self.sheet is not None:
+            return
         try:
-            self.sheet = pygame.image.load(filename)
             self.sheet = pygame.image.load(filename)
             if not self.sheet.get_alpha():
                 self.sheet.set_colorkey((0, 0, 0))
         except pygame.error:
             print("Unable to load spritesheet image:", filename)
             raise SystemExit
+        Spritesheet.sheets[filename] = self.sheet
 
     def image_at(self, x, y, scalingfactor, colorkey=None, ignoreTileSize=False,
                  xTileSize=16, yTileSize=16):
@@ -24,6 +44,8 @@ class Spritesheet(object):
             if colorkey == -1:
                 colorkey = image.get_at((0, 0))
             image.set_colorkey(colorkey, pygame.RLEACCEL)
-        return pygame.transform.scale(
-            image, (xTileSize * scalingfactor, yTileSize * scalingfactor)
+        return convertSurface(
+            pygame.transform.scale(
+                image, (xTileSize * scalingfactor, yTileSize * scalingfactor)
+            )
         )
@@ -2,6 +2,8 @@ import pygame
 
 
 class Tile:
+    __slots__ = ("sprite", "rect")
+
     def __init__(self, sprite, rect):
         self.sprite = sprite
         self.rect = rect
@@ -0,0 +1,30 @@
+import pygame
+
+
+class TransformCache:
+    # flipped and scaled variants of sprites, made once per source surface
+    # and reused every frame instead of allocating a new surface per blit
+    def __init__(self):
+        self.surfaces = {}
+
+    def flip(self, image, flipX=True, flipY=False):
+        key = (image, "flip", flipX, flipY)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = pygame.transform.flip(image, flipX, flipY)
+            self.surfaces[key] = surface
+        return surface
+
+    def scale(self, image, size):
+        key = (image, "scale", size)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = pygame.transform.scale(image, size)
+            self.surfaces[key] = surface
+        return surface
+
+    def clear(self):
+        self.surfaces = {}
+
+
+transforms = TransformCache()
@@ -0,0 +1,154 @@
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from classes.Animation import clock
+
+
+def rectRounds():
+    # newer pygame rounds float Rect coordinates half away from zero, older
+    # releases truncate them; the batch has to land on the same pixels
+    rect = pygame.Rect(0, 0, 1, 1)
+    rect.x = 2.5
+    return rect.x == 3
+
+
+class WalkerPhysics:
+    # gravity, LeftRightWalkTrait movement and Collider tile checks for every
+    # walking mob at once, as NumPy passes over their positions; each entity
+    # ends up where walking on its own would have put it, except that its
+    # checks against other mobs now see all of them already moved
+    def __init__(self, level):
+        if numpy is None:
+            raise ImportError("batched walker physics needs numpy")
+        self.levelObj = level
+        self.rounds = rectRounds()
+        self.minimumBatch = 32
+        # the six tiles Collider looks at: three rows by two columns
+        self.rowOffsets = numpy.repeat(numpy.arange(3), 2)
+        self.columnOffsets = numpy.tile(numpy.arange(2), 3)
+
+    def toRect(self, values):
+        if self.rounds:
+            return numpy.copysign(numpy.floor(numpy.abs(values) + 0.5), values)
+        return numpy.trunc(values)
+
+    def step(self, entities):
+        walkers = []
+        for entity in entities:
+            speed = entity.walkSpeed()
+            if speed is not None:
+                walkers.append((entity, speed))
+        if len(walkers) < self.minimumBatch:
+            # too few to pay for the NumPy calls, they walk one by one instead
+            return
+        state = numpy.array(
+            [
+                (
+                    entity.rect.x,
+                    entity.rect.y,
+                    entity.rect.w,
+                    entity.rect.h,
+                    entity.vel.x,
+                    entity.vel.y,
+                    entity.gravity if entity.obeyGravity else 0,
+                    entity.leftrightTrait.direction,
+                    speed,
+                )
+                for entity, speed in walkers
+            ],
+            dtype=float,
+        )
+        x, y, w, h, vx, vy, gravity, direction, speed = state.T
+        grid = self.solidityArray()
+        height = grid.shape[0]
+
+        # EntityBase.applyGravity and LeftRightWalkTrait.update
+        vy = vy + gravity
+        direction = numpy.where(vx == 0, -direction, direction)
+        vx = speed * direction
+        y = self.toRect(y + vy)
+
+        # Collider.checkY; falling out of the level kills a mob
+        posY = y // 32
+        inLevel = (-height <= posY) & (posY < height - 2)
+        hit, left, top = self.firstSolidTile(grid, x, y, w, h, inLevel)
+        down = hit & (vy > 0)
+        up = hit & (vy < 0)
+        y = numpy.where(down, top - h, numpy.where(up, top + 32, y))
+        vy = numpy.where(down | up, 0, vy)
+
+        # Collider.checkX, level borders first
+        x = self.toRect(x + vx)
+        length = self.levelObj.levelLength
+        leftBorder = x < 0
+        rightBorder = ~leftBorder & (x / 32.0 > length - 1)
+        x = numpy.where(leftBorder, 0, numpy.where(rightBorder, (length - 1) * 32, x))
+        vx = numpy.where(leftBorder | rightBorder, 0, vx)
+        posY = y // 32
+        check = ~leftBorder & ~rightBorder & (-height <= posY) & (posY < height - 2)
+        hit, left, top = self.firstSolidTile(grid, x, y, w, h, check)
+        right = hit & (vx > 0)
+        back = hit & (vx < 0)
+        x = numpy.where(right, left - w, numpy.where(back, left + 32, x))
+        vx = numpy.where(right | back, 0, vx)
+
+        frame = clock.frame
+        for (entity, speed), newX, newY, velX, velY, onGround, newDirection, alive in zip(
+            walkers,
+            x.astype(int).tolist(),
+            y.astype(int).tolist(),
+            vx.astype(int).tolist(),
+            vy.tolist(),
+            down.tolist(),
+            direction.astype(int).tolist(),
+            inLevel.tolist(),
+        ):
+            entity.rect.x = newX
+            entity.rect.y = newY
+            entity.vel.x = velX
+            entity.vel.y = velY
+            entity.onGround = onGround
+            trait = entity.leftrightTrait
+            trait.direction = newDirection
+            trait.speed = speed
+            trait.walkedFrame = frame
+            if not alive:
+                self.levelObj.removeEntity(entity)
+
+    def solidityArray(self):
+        grid = self.levelObj.solidity
+        return numpy.frombuffer(b"".join(grid), dtype=numpy.uint8).reshape(len(grid), -1)
+
+    def firstSolidTile(self, grid, x, y, w, h, mask):
+        # Collider.solidTiles for all walkers at once: the six tiles under
+        # each one, in the same order (rows, then the two columns); only the
+        # first overlapping tile matters, as it zeroes the velocity on that axis
+        height, width = grid.shape
+        tileX = (x // 32)[:, None] + self.columnOffsets
+        tileY = (y // 32)[:, None] + self.rowOffsets
+        valid = (
+            mask[:, None]
+            & (tileY >= 0)
+            & ((x // 32)[:, None] >= 0)
+            & (tileX < width)
+        )
+        value = grid[
+            numpy.clip(tileY, 0, height - 1).astype(int),
+            numpy.clip(tileX, 0, width - 1).astype(int),
+        ] * valid
+        tileLeft = tileX * 32
+        tileTop = tileY * 32 + 1 - value
+        overlaps = (
+            (value > 0)
+            & (x[:, None] < tileLeft + 32)
+            & (tileLeft < (x + w)[:, None])
+            & (y[:, None] < tileTop + 32)
+            & (tileTop < (y + h)[:, None])
+        )
+        first = overlaps.argmax(axis=1)
+        rows = numpy.arange(len(x))
+        return overlaps.any(axis=1), tileLeft[rows, first], tileTop[rows, first]
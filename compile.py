@@ -8,7 +8,7 @@ setup(
     console=["main.py"],
     # data files - these are the non-python files, like images and sounds
     data_files=[
-        ("sprites", glob.glob("sprites\\*.json")),
+        ("sprites", glob.glob("sprites\\*.json") + glob.glob("sprites\\*.pack")),
         ("sfx", glob.glob("sfx\\*.ogg") + glob.glob("sfx\\*.wav")),
         ("levels", glob.glob("levels\\*.json")),
         ("img", glob.glob("img\\*.gif") + glob.glob("img\\*.png")),
@@ -1,11 +1,16 @@
+import math
+
 import pygame
-import random
 
+from classes.Log import log
 from entities.EntityBase import EntityBase
-from entities.BossFire import BossFire
 
 
 class Boss(EntityBase):
+    __slots__ = (
+        "screen", "spriteCollection", "levelObj", "sound", "fireCooldown", "health",
+    )
+
     def __init__(self, screen, spriteColl, x, y, level, sound):
         super(Boss, self).__init__(x, y, 0)
         self.screen = screen
@@ -16,7 +21,7 @@ class Boss(EntityBase):
         self.timer = 0
         self.fireCooldown = 10  # frames between fires (very small for quick visual testing)
         self.health = 5
-        print(f"Boss instantiated at tile ({x},{y})")
+        log.debug("Boss instantiated at tile ({},{})", x, y)
 
     def update(self, camera):
         if not self.alive:
@@ -26,6 +31,8 @@ class Boss(EntityBase):
         if self.timer >= self.fireCooldown:
             self.fireAtPlayer()
             self.timer = 0
+
+    def draw(self, camera):
         # draw boss as a simple rectangle for now
         try:
             pygame.draw.rect(
@@ -37,13 +44,8 @@ class Boss(EntityBase):
             pass
 
     def fireAtPlayer(self):
-        # find mario and fire in his direction
-        mario = getattr(self.levelObj, 'player', None)
-        if mario is None:
-            for ent in self.levelObj.entityList:
-                if ent.__class__.__name__ == 'Mario':
-                    mario = ent
-                    break
+        # fire in Mario's direction
+        mario = self.levelObj.player
         if mario is None:
             return
         # compute a velocity vector aimed at Mario's center
@@ -51,7 +53,6 @@ class Boss(EntityBase):
         bx, by = self.rect.center
         dx = mx - bx
         dy = my - by
-        import math
         dist = math.hypot(dx, dy)
         if dist == 0:
             ux, uy = 1.0, 0.0
@@ -62,6 +63,5 @@ class Boss(EntityBase):
         # spawn projectile at boss center tile coordinates (convert to tile indices)
         tx = (self.rect.x // 32)
         ty = (self.rect.y // 32)
-        proj = BossFire(self.screen, self.spriteCollection, tx, ty, vx, vy, self.levelObj, self.sound)
-        self.levelObj.entityList.append(proj)
-        print(f"Boss fired projectile vx={vx:.2f}, vy={vy:.2f} from tile ({tx},{ty})")
+        self.levelObj.projectiles.fire(tx, ty, vx, vy)
+        log.debug("Boss fired projectile vx={:.2f}, vy={:.2f} from tile ({},{})", vx, vy, tx, ty)
@@ -1,15 +1,19 @@
-from copy import copy
-
+from classes.Animation import clock
 from entities.EntityBase import EntityBase
 from entities.Item import Item
 
 
 class CoinBox(EntityBase):
+    __slots__ = (
+        "screen", "spriteCollection", "animation", "triggered", "time", "maxTime",
+        "sound", "dashboard", "item",
+    )
+
     def __init__(self, screen, spriteCollection, x, y, sound, dashboard, gravity=0):
         super(CoinBox, self).__init__(x, y, gravity)
         self.screen = screen
         self.spriteCollection = spriteCollection
-        self.animation = copy(self.spriteCollection.get("CoinBox").animation)
+        self.animation = self.spriteCollection.get("CoinBox").animation
         self.type = "Block"
         self.triggered = False
         self.time = 0
@@ -20,11 +24,8 @@ class CoinBox(EntityBase):
         self.item = Item(spriteCollection, screen, self.rect.x, self.rect.y)
 
     def update(self, cam):
-        if self.alive and not self.triggered:
-            self.animation.update()
-        else:
-            self.animation.image = self.spriteCollection.get("empty").image
-            self.item.spawnCoin(cam, self.sound, self.dashboard)
+        if not self.alive or self.triggered:
+            self.item.spawnCoin(self.sound, self.dashboard)
             if self.time < self.maxTime:
                 self.time += 1
                 self.rect.y -= self.vel
@@ -32,8 +33,16 @@ class CoinBox(EntityBase):
                 if self.time < self.maxTime * 2:
                     self.time += 1
                     self.rect.y += self.vel
+
+    def draw(self, cam):
+        if not self.alive or self.triggered:
+            self.item.drawCoin(cam)
         self.screen.blit(
             self.spriteCollection.get("sky").image,
             (self.rect.x + cam.x, self.rect.y + 2),
         )
-        self.screen.blit(self.animation.image, (self.rect.x + cam.x, self.rect.y - 1))
+        if not self.alive or self.triggered:
+            image = self.spriteCollection.get("empty").image
+        else:
+            image = clock.image(self.animation)
+        self.screen.blit(image, (self.rect.x + cam.x, self.rect.y - 1))
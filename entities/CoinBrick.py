@@ -5,6 +5,10 @@ from entities.Item import Item
 
 
 class CoinBrick(EntityBase):
+    __slots__ = (
+        "screen", "spriteCollection", "image", "triggered", "sound", "dashboard", "item",
+    )
+
     def __init__(self, screen, spriteCollection, x, y, sound, dashboard, gravity=0):
         super(CoinBrick, self).__init__(x, y, gravity)
         self.screen = screen
@@ -19,7 +23,11 @@ class CoinBrick(EntityBase):
     def update(self, cam):
         if not self.alive or self.triggered:
             self.image = self.spriteCollection.get("empty").image
-            self.item.spawnCoin(cam, self.sound, self.dashboard)
+            self.item.spawnCoin(self.sound, self.dashboard)
+
+    def draw(self, cam):
+        if not self.alive or self.triggered:
+            self.item.drawCoin(cam)
         self.screen.blit(
             self.spriteCollection.get("sky").image,
             (self.rect.x + cam.x, self.rect.y + 2),
@@ -4,6 +4,17 @@ from classes.Maths import Vec2D
 
 
 class EntityBase(object):
+    # subclasses list their own attributes in __slots__ too, so that the
+    # thousands of coins and mobs in a big level carry no __dict__; Mario is
+    # the one entity left with a __dict__
+    __slots__ = (
+        "vel", "rect", "gravity", "traits", "alive", "active", "bouncing",
+        "timeAfterDeath", "timer", "type", "onGround", "obeyGravity",
+        "previousPos",
+    )
+    # Level stops updating entities that are far off screen
+    sleepOffscreen = True
+
     def __init__(self, x, y, gravity):
         self.vel = Vec2D()
         self.rect = pygame.Rect(x * 32, y * 32, 32, 32)
@@ -17,7 +28,19 @@ class EntityBase(object):
         self.type = ""
         self.onGround = False
         self.obeyGravity = True
-        
+        self.previousPos = None
+
+    def update(self, camera):
+        pass
+
+    def draw(self, camera):
+        pass
+
+    def walkSpeed(self):
+        # the speed a walking mob moves at in its next update, None when it
+        # does not walk; classes/WalkerPhysics.py batches the walkers
+        return None
+
     def applyGravity(self):
         if self.obeyGravity:
             self.vel.y += self.gravity
@@ -29,6 +52,19 @@ class EntityBase(object):
             except AttributeError:
                 pass
 
+    def savePosition(self):
+        self.previousPos = (self.rect.x, self.rect.y)
+
+    def renderPosition(self, alpha):
+        # position between the previous and the current logic step
+        if self.previousPos is None:
+            return self.rect.x, self.rect.y
+        x, y = self.previousPos
+        return (
+            int(round(x + (self.rect.x - x) * alpha)),
+            int(round(y + (self.rect.y - y) * alpha)),
+        )
+
     def getPosIndex(self):
         return Vec2D(self.rect.x // 32, self.rect.y // 32)
 
@@ -1,50 +1,64 @@
-from classes.Animation import Animation
-from classes.Collider import Collider
-from classes.EntityCollider import EntityCollider
+from classes.Animation import clock
+from classes.EntityCollider import entityCollider
 from classes.Maths import Vec2D
+from classes.Profiler import profiler
 from entities.EntityBase import EntityBase
 from traits.leftrightwalk import LeftRightWalkTrait
 
 
 class Goomba(EntityBase):
+    __slots__ = (
+        "spriteCollection", "animation", "animationStart", "screen", "leftrightTrait",
+        "dashboard", "levelObj", "sound", "textPos",
+    )
+
     def __init__(self, screen, spriteColl, x, y, level, sound):
         super(Goomba, self).__init__(y, x - 1, 1.25)
         self.spriteCollection = spriteColl
-        self.animation = Animation(
+        self.animation = clock.shared(
             [
                 self.spriteCollection.get("goomba-1").image,
                 self.spriteCollection.get("goomba-2").image,
             ]
         )
+        self.animationStart = clock.frame
         self.screen = screen
         self.leftrightTrait = LeftRightWalkTrait(self, level)
         self.type = "Mob"
         self.dashboard = level.dashboard
-        self.collision = Collider(self, level)
-        self.EntityCollider = EntityCollider(self)
         self.levelObj = level
         self.sound = sound
         self.textPos = Vec2D(0, 0)
 
     def update(self, camera):
         if self.alive:
-            self.applyGravity()
-            self.drawGoomba(camera)
-            self.leftrightTrait.update()
+            self.leftrightTrait.walk()
             self.checkEntityCollision()
         else:
-            self.onDead(camera)
+            self.onDead()
+
+    def walkSpeed(self):
+        return self.leftrightTrait.speed if self.alive else None
+
+    def draw(self, camera):
+        # timer only starts running once onDead has placed the points text
+        if self.alive or self.timer == 0:
+            self.drawGoomba(camera)
+        else:
+            self.drawFlatGoomba(camera)
+            self.drawPointsText(camera)
 
     def drawGoomba(self, camera):
-        self.screen.blit(self.animation.image, (self.rect.x + camera.x, self.rect.y))
-        self.animation.update()
+        self.screen.blit(
+            clock.image(self.animation, self.animationStart),
+            (self.rect.x + camera.x, self.rect.y),
+        )
 
-    def onDead(self, camera):
+    def onDead(self):
         if self.timer == 0:
             self.setPointsTextStartPosition(self.rect.x + 3, self.rect.y)
         if self.timer < self.timeAfterDeath:
-            self.movePointsTextUpAndDraw(camera)
-            self.drawFlatGoomba(camera)
+            self.movePointsTextUp()
         else:
             self.alive = None
         self.timer += 0.1
@@ -58,16 +72,20 @@ class Goomba(EntityBase):
     def setPointsTextStartPosition(self, x, y):
         self.textPos = Vec2D(x, y)
 
-    def movePointsTextUpAndDraw(self, camera):
+    def movePointsTextUp(self):
         self.textPos.y += -0.5
+
+    def drawPointsText(self, camera):
         self.dashboard.drawText("100", self.textPos.x + camera.x, self.textPos.y, 8)
     
     def checkEntityCollision(self):
-        for ent in self.levelObj.entityList:
-            collisionState = self.EntityCollider.check(ent)
+        start = profiler.begin()
+        for ent in self.levelObj.nearbyEntities(self.rect):
+            collisionState = entityCollider.check(self, ent)
             if collisionState.isColliding:
                 if ent.type == "Mob":
                     self._onCollisionWithMob(ent, collisionState)
+        profiler.end("collision", start)
 
     def _onCollisionWithMob(self, mob, collisionState):
         if collisionState.isColliding and mob.bouncing:
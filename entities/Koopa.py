@@ -1,88 +1,103 @@
-import pygame
-
-from classes.Animation import Animation
-from classes.Collider import Collider
-from classes.EntityCollider import EntityCollider
+from classes.Animation import clock
+from classes.EntityCollider import entityCollider
 from classes.Maths import Vec2D
+from classes.Profiler import profiler
+from classes.Transform import transforms
 from entities.EntityBase import EntityBase
 from traits.leftrightwalk import LeftRightWalkTrait
 
 
 class Koopa(EntityBase):
+    __slots__ = (
+        "spriteCollection", "animation", "animationStart", "screen", "leftrightTrait",
+        "dashboard", "levelObj", "sound",
+    )
+
     def __init__(self, screen, spriteColl, x, y, level, sound):
         super(Koopa, self).__init__(y - 1, x, 1.25)
         self.spriteCollection = spriteColl
-        self.animation = Animation(
+        self.animation = clock.shared(
             [
                 self.spriteCollection.get("koopa-1").image,
                 self.spriteCollection.get("koopa-2").image,
             ]
         )
+        self.animationStart = clock.frame
         self.screen = screen
         self.leftrightTrait = LeftRightWalkTrait(self, level)
         self.timer = 0
         self.timeAfterDeath = 35
         self.type = "Mob"
         self.dashboard = level.dashboard
-        self.collision = Collider(self, level)
-        self.EntityCollider = EntityCollider(self)
         self.levelObj = level
         self.sound = sound
 
     def update(self, camera):
         if self.alive and self.active:
-            self.updateAlive(camera)
+            self.updateAlive()
             self.checkEntityCollision()
         elif self.alive and not self.active and not self.bouncing:
-            self.sleepingInShell(camera)
+            self.sleepingInShell()
             self.checkEntityCollision()
         elif self.bouncing:
-            self.shellBouncing(camera)
+            self.shellBouncing()
+
+    def walkSpeed(self):
+        # mirrors the branches of update()
+        if self.alive and self.active:
+            return self.leftrightTrait.speed
+        elif self.alive and not self.active and not self.bouncing:
+            return None
+        elif self.bouncing:
+            return 4
+        return None
 
-    def drawKoopa(self, camera):
+    def draw(self, camera):
+        if self.alive and self.active:
+            self.drawKoopa(camera, clock.image(self.animation, self.animationStart))
+        elif self.alive and not self.active and not self.bouncing:
+            self.screen.blit(
+                self.spriteCollection.get("koopa-hiding").image,
+                (self.rect.x + camera.x, self.rect.y - 32),
+            )
+        elif self.bouncing:
+            self.drawKoopa(camera, self.spriteCollection.get("koopa-hiding").image)
+
+    def drawKoopa(self, camera, image):
         if self.leftrightTrait.direction == -1:
             self.screen.blit(
-                self.animation.image, (self.rect.x + camera.x, self.rect.y - 32)
+                image, (self.rect.x + camera.x, self.rect.y - 32)
             )
         else:
             self.screen.blit(
-                pygame.transform.flip(self.animation.image, True, False),
+                transforms.flip(image),
                 (self.rect.x + camera.x, self.rect.y - 32),
             )
 
-    def shellBouncing(self, camera):
+    def shellBouncing(self):
         self.leftrightTrait.speed = 4
-        self.applyGravity()
-        self.animation.image = self.spriteCollection.get("koopa-hiding").image
-        self.drawKoopa(camera)
-        self.leftrightTrait.update()
+        self.leftrightTrait.walk()
 
-    def sleepingInShell(self, camera):
-        if self.timer < self.timeAfterDeath:
-            self.screen.blit(
-                self.spriteCollection.get("koopa-hiding").image,
-                (self.rect.x + camera.x, self.rect.y - 32),
-            )
-        else:
+    def sleepingInShell(self):
+        if self.timer >= self.timeAfterDeath:
             self.alive = True
             self.active = True
             self.bouncing = False
             self.timer = 0
         self.timer += 0.1
 
-    def updateAlive(self, camera):
-        self.applyGravity()
-        self.drawKoopa(camera)
-        self.animation.update()
-        self.leftrightTrait.update()
+    def updateAlive(self):
+        self.leftrightTrait.walk()
 
     def checkEntityCollision(self):
-        for ent in self.levelObj.entityList:
+        start = profiler.begin()
+        for ent in self.levelObj.nearbyEntities(self.rect):
             if ent is not self:
-                collisionState = self.EntityCollider.check(ent)
+                collisionState = entityCollider.check(self, ent)
                 if collisionState.isColliding:
                     if ent.type == "Mob":
                         self._onCollisionWithMob(ent, collisionState)
+        profiler.end("collision", start)
 
     def _onCollisionWithMob(self, mob, collisionState):
         if collisionState.isColliding and mob.bouncing:
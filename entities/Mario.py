@@ -2,10 +2,10 @@ import pygame
 
 from classes.Animation import Animation
 from classes.Camera import Camera
-from classes.Collider import Collider
-from classes.EntityCollider import EntityCollider
+from classes.EntityCollider import entityCollider
 from classes.Input import Input
-from classes.Sprites import Sprites
+from classes.Presenter import presenter
+from classes.Profiler import profiler
 from entities.EntityBase import EntityBase
 from entities.Mushroom import RedMushroom
 from traits.bounce import bounceTrait
@@ -13,31 +13,30 @@ from traits.go import GoTrait
 from traits.jump import JumpTrait
 from classes.Pause import Pause
 
-spriteCollection = Sprites().spriteCollection
-smallAnimation = Animation(
-    [
-        spriteCollection["mario_run1"].image,
-        spriteCollection["mario_run2"].image,
-        spriteCollection["mario_run3"].image,
-    ],
-    spriteCollection["mario_idle"].image,
-    spriteCollection["mario_jump"].image,
-)
-bigAnimation = Animation(
-    [
-        spriteCollection["mario_big_run1"].image,
-        spriteCollection["mario_big_run2"].image,
-        spriteCollection["mario_big_run3"].image,
-    ],
-    spriteCollection["mario_big_idle"].image,
-    spriteCollection["mario_big_jump"].image,
-)
-
 
 class Mario(EntityBase):
     def __init__(self, x, y, level, screen, dashboard, sound, gravity=0.8):
         super(Mario, self).__init__(x, y, gravity)
         self.camera = Camera(self.rect, self)
+        spriteCollection = level.sprites.spriteCollection
+        self.smallAnimation = Animation(
+            [
+                spriteCollection["mario_run1"].image,
+                spriteCollection["mario_run2"].image,
+                spriteCollection["mario_run3"].image,
+            ],
+            spriteCollection["mario_idle"].image,
+            spriteCollection["mario_jump"].image,
+        )
+        self.bigAnimation = Animation(
+            [
+                spriteCollection["mario_big_run1"].image,
+                spriteCollection["mario_big_run2"].image,
+                spriteCollection["mario_big_run3"].image,
+            ],
+            spriteCollection["mario_big_idle"].image,
+            spriteCollection["mario_big_jump"].image,
+        )
         self.sound = sound
         self.input = Input(self)
         self.inAir = False
@@ -46,20 +45,21 @@ class Mario(EntityBase):
         self.invincibilityFrames = 0
         self.traits = {
             "jumpTrait": JumpTrait(self),
-            "goTrait": GoTrait(smallAnimation, screen, self.camera, self),
+            "goTrait": GoTrait(self.smallAnimation, screen, self.camera, self),
             "bounceTrait": bounceTrait(self),
         }
 
         self.levelObj = level
-        self.collision = Collider(self, level)
+        self.collision = level.collider
         self.screen = screen
-        self.EntityCollider = EntityCollider(self)
         self.dashboard = dashboard
         self.restart = False
         self.pause = False
         self.pauseObj = Pause(screen, self, dashboard)
 
     def update(self):
+        start = profiler.begin()
+        self.savePosition()
         if self.invincibilityFrames > 0:
             self.invincibilityFrames -= 1
         self.updateTraits()
@@ -68,16 +68,27 @@ class Mario(EntityBase):
         self.applyGravity()
         self.checkEntityCollision()
         self.input.checkForInput()
+        profiler.end("mario", start)
+
+    def draw(self, camera=None, alpha=1.0):
+        if camera is None:
+            camera = self.camera
+        if (self.invincibilityFrames//2) % 2 == 0:
+            x, y = self.renderPosition(alpha)
+            self.traits["goTrait"].drawEntity((camera.x + x, y))
 
     def moveMario(self):
+        start = profiler.begin()
         self.rect.y += self.vel.y
-        self.collision.checkY()
+        self.collision.checkY(self)
         self.rect.x += self.vel.x
-        self.collision.checkX()
+        self.collision.checkX(self)
+        profiler.end("collision", start)
 
     def checkEntityCollision(self):
-        for ent in self.levelObj.entityList:
-            collisionState = self.EntityCollider.check(ent)
+        start = profiler.begin()
+        for ent in self.levelObj.nearbyEntities(self.rect):
+            collisionState = entityCollider.check(self, ent)
             if collisionState.isColliding:
                 if ent.type == "Item":
                     self._onCollisionWithItem(ent)
@@ -85,9 +96,10 @@ class Mario(EntityBase):
                     self._onCollisionWithBlock(ent)
                 elif ent.type == "Mob":
                     self._onCollisionWithMob(ent, collisionState)
+        profiler.end("collision", start)
 
     def _onCollisionWithItem(self, item):
-        self.levelObj.entityList.remove(item)
+        self.levelObj.removeEntity(item)
         self.dashboard.points += 100
         self.dashboard.coins += 1
         self.sound.play_sfx(self.sound.coin)
@@ -129,7 +141,7 @@ class Mario(EntityBase):
                 self.gameOver()
             elif self.powerUpState == 1:
                 self.powerUpState = 0
-                self.traits['goTrait'].updateAnimation(smallAnimation)
+                self.traits['goTrait'].updateAnimation(self.smallAnimation)
                 x, y = self.rect.x, self.rect.y
                 self.rect = pygame.Rect(x, y + 32, 32, 32)
                 self.invincibilityFrames = 60
@@ -150,6 +162,10 @@ class Mario(EntityBase):
         self.dashboard.points += 100
 
     def gameOver(self):
+        if pygame.display.get_surface() is None:
+            # headless simulation: there is no death animation to play out
+            self.restart = True
+            return
         srf = pygame.Surface((640, 480))
         srf.set_colorkey((255, 255, 255), pygame.RLEACCEL)
         srf.set_alpha(128)
@@ -165,10 +181,10 @@ class Mario(EntityBase):
                 i,
             )
             self.screen.blit(srf, (0, 0))
-            pygame.display.update()
+            presenter.present()
             self.input.checkForInput()
         while self.sound.music_channel.get_busy():
-            pygame.display.update()
+            presenter.present()
             self.input.checkForInput()
         self.restart = True
 
@@ -183,6 +199,6 @@ class Mario(EntityBase):
         if self.powerUpState == 0:
             if powerupID == 1:
                 self.powerUpState = 1
-                self.traits['goTrait'].updateAnimation(bigAnimation)
+                self.traits['goTrait'].updateAnimation(self.bigAnimation)
                 self.rect = pygame.Rect(self.rect.x, self.rect.y-32, 32, 64)
                 self.invincibilityFrames = 20
@@ -1,16 +1,19 @@
-from classes.Animation import Animation
+from classes.Animation import clock
 from classes.Maths import Vec2D
 from entities.EntityBase import EntityBase
 from traits.leftrightwalk import LeftRightWalkTrait
-from classes.Collider import Collider
-from classes.EntityCollider import EntityCollider
 
 
 class RedMushroom(EntityBase):
+    __slots__ = (
+        "spriteCollection", "animation", "screen", "leftrightTrait", "dashboard",
+        "levelObj", "sound", "textPos",
+    )
+
     def __init__(self, screen, spriteColl, x, y, level, sound):
         super(RedMushroom, self).__init__(y, x - 1, 1.25)
         self.spriteCollection = spriteColl
-        self.animation = Animation(
+        self.animation = clock.shared(
             [
                 self.spriteCollection.get("mushroom").image,
             ]
@@ -19,29 +22,34 @@ class RedMushroom(EntityBase):
         self.leftrightTrait = LeftRightWalkTrait(self, level)
         self.type = "Mob"
         self.dashboard = level.dashboard
-        self.collision = Collider(self, level)
-        self.EntityCollider = EntityCollider(self)
         self.levelObj = level
         self.sound = sound
 
     def update(self, camera):
         if self.alive:
-            self.applyGravity()
-            self.drawRedMushroom(camera)
-            self.leftrightTrait.update()
+            self.leftrightTrait.walk()
             self.checkEntityCollision()
         else:
-            self.onDead(camera)
+            self.onDead()
+
+    def walkSpeed(self):
+        return self.leftrightTrait.speed if self.alive else None
+
+    def draw(self, camera):
+        # timer only starts running once onDead has placed the points text
+        if self.alive or self.timer == 0:
+            self.drawRedMushroom(camera)
+        else:
+            self.drawPointsText(camera)
 
     def drawRedMushroom(self, camera):
-        self.screen.blit(self.animation.image, (self.rect.x + camera.x, self.rect.y))
-        self.animation.update()
+        self.screen.blit(clock.image(self.animation), (self.rect.x + camera.x, self.rect.y))
 
-    def onDead(self, camera):
+    def onDead(self):
         if self.timer == 0:
             self.setPointsTextStartPosition(self.rect.x + 3, self.rect.y)
         if self.timer < self.timeAfterDeath:
-            self.movePointsTextUpAndDraw(camera)
+            self.movePointsTextUp()
         else:
             self.alive = None
         self.timer += 0.1
@@ -49,8 +57,10 @@ class RedMushroom(EntityBase):
     def setPointsTextStartPosition(self, x, y):
         self.textPos = Vec2D(x, y)
 
-    def movePointsTextUpAndDraw(self, camera):
+    def movePointsTextUp(self):
         self.textPos.y += -0.5
+
+    def drawPointsText(self, camera):
         self.dashboard.drawText("100", self.textPos.x + camera.x, self.textPos.y, 8)
 
     def checkEntityCollision(self):
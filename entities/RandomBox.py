@@ -1,14 +1,18 @@
-from copy import copy
-
+from classes.Animation import clock
 from entities.EntityBase import EntityBase
 
 
 class RandomBox(EntityBase):
+    __slots__ = (
+        "screen", "spriteCollection", "animation", "triggered", "time", "maxTime",
+        "sound", "dashboard", "item", "level",
+    )
+
     def __init__(self, screen, spriteCollection, x, y, item, sound, dashboard, level, gravity=0):
         super(RandomBox, self).__init__(x, y, gravity)
         self.screen = screen
         self.spriteCollection = spriteCollection
-        self.animation = copy(self.spriteCollection.get("CoinBox").animation)
+        self.animation = self.spriteCollection.get("CoinBox").animation
         self.type = "Block"
         self.triggered = False
         self.time = 0
@@ -20,10 +24,7 @@ class RandomBox(EntityBase):
         self.level = level
 
     def update(self, cam):
-        if self.alive and not self.triggered:
-            self.animation.update()
-        else:
-            self.animation.image = self.spriteCollection.get("empty").image
+        if not self.alive or self.triggered:
             if self.item == 'RedMushroom':
                 self.level.addRedMushroom(self.rect.y // 32 - 1, self.rect.x // 32)
                 self.sound.play_sfx(self.sound.powerup_appear)
@@ -35,8 +36,14 @@ class RandomBox(EntityBase):
                 if self.time < self.maxTime * 2:
                     self.time += 1
                     self.rect.y += self.vel
+
+    def draw(self, cam):
         self.screen.blit(
             self.spriteCollection.get("sky").image,
             (self.rect.x + cam.x, self.rect.y + 2),
         )
-        self.screen.blit(self.animation.image, (self.rect.x + cam.x, self.rect.y - 1))
+        if not self.alive or self.triggered:
+            image = self.spriteCollection.get("empty").image
+        else:
+            image = clock.image(self.animation)
+        self.screen.blit(image, (self.rect.x + cam.x, self.rect.y - 1))
@@ -0,0 +1,60 @@
+# Steps a level without a window and without drawing anything, as fast as the
+# game logic allows. Mario gets no input unless a recording is replayed, so
+# this mostly exercises the mobs.
+#
+# run from the repository root: python headless.py [levelName] [--frames N]
+#                               python headless.py --replay FILE
+# add --batch-physics to move the walking mobs with classes.WalkerPhysics
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from classes.Replay import InputReplay
+from classes.Simulation import Simulation
+from classes.WalkerPhysics import WalkerPhysics
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("levelName", nargs="?", default="Level1-1")
+    parser.add_argument("--frames", type=int, default=3600)
+    parser.add_argument("--replay", metavar="FILE",
+                        help="drive Mario with a recording made by main.py --record")
+    parser.add_argument("--batch-physics", action="store_true",
+                        help="move walking mobs in NumPy batches")
+    args = parser.parse_args()
+    pygame.mixer.pre_init(44100, -16, 2, 4096)
+    pygame.init()
+    levelName = args.levelName
+    if args.replay is not None:
+        replay = InputReplay(args.replay)
+        levelName = replay.levelName
+        simulation = Simulation(levelName, seed=replay.seed)
+        simulation.mario.input.replay = replay
+    else:
+        simulation = Simulation(levelName)
+    if args.batch_physics:
+        simulation.level.walkerPhysics = WalkerPhysics(simulation.level)
+    start = time.perf_counter()
+    simulated = simulation.run(args.frames)
+    elapsed = time.perf_counter() - start
+    print(
+        "{}: {:d} frames in {:.2f}s ({:,.0f} frames/s)".format(
+            levelName, simulated, elapsed, simulated / elapsed
+        )
+    )
+    mario = simulation.mario
+    print(
+        "mario at {:d},{:d}, {:d} points, {:d} coins".format(
+            mario.rect.x, mario.rect.y, simulation.dashboard.points, simulation.dashboard.coins
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,65 +1,124 @@
+import argparse
+
 import pygame
 from classes.Dashboard import Dashboard
+from classes.Debug import debug
 from classes.Level import Level
 from classes.Menu import Menu
+from classes.Presenter import Presenter, presenter
+from classes.Profiler import profiler
+from classes.Replay import InputRecorder, InputReplay, freeRecordingPath
 from classes.Sound import Sound
 from entities.Mario import Mario
 
 
 windowSize = 1280, 720
 logical_size = 640, 480
+# game logic always advances in 60 Hz steps, whatever the render rate
+logic_step = 1000.0 / 60
+max_logic_steps = 5
 
 
-def main():
+def main(recordPath=None, replayPath=None, scaleMode="fit"):
     pygame.mixer.pre_init(44100, -16, 2, 4096)
     pygame.init()
-    screen = pygame.display.set_mode(windowSize)
-    # Create a logical surface where the game will be drawn at native 640x480
-    logical_surface = pygame.Surface(logical_size)
+    # the game is drawn into a logical surface at its native 640x480
+    logical_surface = presenter.setMode(scaleMode, logical_size, windowSize)
     max_frame_rate = 60
     # Pass the logical_surface to game systems so all drawing happens at 640x480
     dashboard = Dashboard("./img/font.png", 8, logical_surface)
     sound = Sound()
-    level = Level(logical_surface, sound, dashboard)
-    menu = Menu(logical_surface, dashboard, level, sound)
+    replay = InputReplay(replayPath) if replayPath is not None else None
+    level = Level(logical_surface, sound, dashboard, replay.seed if replay else None)
+
+    if replay is not None:
+        # a replay skips the menu and starts the recorded level right away
+        dashboard.state = "start"
+        dashboard.levelName = replay.levelName.split("Level")[-1]
+        level.loadLevel(replay.levelName)
+    else:
+        menu = Menu(logical_surface, dashboard, level, sound)
 
-    while not menu.start:
-        # Draw menu into the logical surface at its native resolution
-        menu.update()
-        # Scale logical surface to window size (nearest-neighbour) and blit
-        scaled = pygame.transform.scale(logical_surface, windowSize)
-        screen.blit(scaled, (0, 0))
-        pygame.display.update()
+        while not menu.start:
+            # Draw menu into the logical surface at its native resolution
+            menu.update()
+            presenter.present()
 
     mario = Mario(0, 0, level, logical_surface, dashboard, sound)
     # expose player on level for easier targeting by entities like Boss
     level.player = mario
+    mario.input.replay = replay
+    if recordPath is not None:
+        mario.input.recorder = InputRecorder(
+            freeRecordingPath(recordPath), level.name, level.seed
+        )
+        print("Recording to", mario.input.recorder.path)
+    try:
+        play(logical_surface, level, dashboard, mario, max_frame_rate)
+    finally:
+        if mario.input.recorder is not None:
+            mario.input.recorder.close()
+    if replay is not None:
+        print("Replayed {:d} steps of {}".format(replay.frames, replay.levelName))
+        return 'replayed'
+    return 'restart'
+
+
+def play(logical_surface, level, dashboard, mario, max_frame_rate):
     clock = pygame.time.Clock()
+    accumulator = 0.0
 
     while not mario.restart:
         pygame.display.set_caption("Super Mario running with {:d} FPS".format(int(clock.get_fps())))
         if mario.pause:
             mario.pauseObj.update()
+            accumulator = 0.0
         else:
-            level.drawLevel(mario.camera)
-            dashboard.update()
-            mario.update()
+            steps = 0
+            while accumulator >= logic_step and steps < max_logic_steps:
+                level.updateEntities(mario.camera)
+                start = profiler.begin()
+                dashboard.update()
+                profiler.end("hud", start)
+                mario.update()
+                accumulator -= logic_step
+                steps += 1
+                if mario.restart or mario.pause:
+                    break
+            if steps == max_logic_steps:
+                # too far behind to catch up: drop the backlog rather than spiral
+                accumulator %= logic_step
+            # draw between the last two logic steps
+            alpha = min(accumulator / logic_step, 1.0)
+            camera = mario.camera.interpolate(alpha)
+            level.drawLevel(camera, alpha)
+            start = profiler.begin()
+            dashboard.draw()
+            profiler.end("hud", start)
+            mario.draw(camera, alpha)
+            debug.draw(logical_surface, level, camera)
 
-        # Debug visuals: Draw a rectangle and text on the logical surface
-        pygame.draw.rect(logical_surface, (255, 0, 0), (10, 10, 100, 50))  # Red rectangle
-        font = pygame.font.Font(None, 36)
-        debug_text = font.render("Debug Mode", True, (255, 255, 255))
-        logical_surface.blit(debug_text, (10, 70))
+        profiler.draw(logical_surface)
 
-        # Scale logical surface to the window size (nearest neighbour for pixel-art)
-        scaled = pygame.transform.scale(logical_surface, windowSize)
-        screen.blit(scaled, (0, 0))
-        pygame.display.update()
-        clock.tick(max_frame_rate)
-    return 'restart'
+        start = profiler.begin()
+        presenter.present()
+        profiler.end("present", start)
+        # the rebuilt HUD is on screen now
+        dashboard.dirty = False
+        profiler.endFrame()
+        accumulator += clock.tick(max_frame_rate)
+        profiler.beginFrame()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--record", metavar="FILE",
+                        help="record the input of the played level to FILE")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="play back a recording made with --record")
+    parser.add_argument("--scale", choices=Presenter.modes, default="fit",
+                        help="how the 640x480 game fills the window (default: fit)")
+    args = parser.parse_args()
     exitmessage = 'restart'
     while exitmessage == 'restart':
-        exitmessage = main()
+        exitmessage = main(args.record, args.replay, args.scale)
@@ -0,0 +1,30 @@
+# Bakes the sliced and scaled sprites, animation frames and font glyphs into
+# ./sprites/assets.pack so the game can skip slicing the sheets at startup.
+# The game falls back to the sprite JSON files whenever the pack is missing
+# or older than any of its sources.
+#
+# run from the repository root: python pack.py
+import json
+
+from classes.AssetPack import AssetPack
+from classes.Font import Font
+from classes.Sprites import Sprites
+
+fontPath = "./img/font.png"
+
+
+def main():
+    sprites = Sprites()
+    sources = list(sprites.urlList) + [fontPath]
+    for url in sprites.urlList:
+        with open(url) as jsonData:
+            sources.append(json.load(jsonData)["spriteSheetURL"])
+    collection = sprites.loadSprites(sprites.urlList)
+    fonts = {fontPath: Font(fontPath, 8).loadFont()}
+    pack = AssetPack()
+    pack.write(collection, fonts, sorted(set(sources)))
+    print("wrote {} ({} sprites)".format(pack.path, len(collection)))
+
+
+if __name__ == "__main__":
+    main()
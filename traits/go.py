@@ -1,4 +1,4 @@
-from pygame.transform import flip
+from classes.Transform import transforms
 
 
 class GoTrait:
@@ -49,17 +49,13 @@ class GoTrait:
                     self.animation.inAir()
                 else:
                     self.animation.idle()
-        if (self.entity.invincibilityFrames//2) % 2 == 0:
-            self.drawEntity()
 
     def updateAnimation(self, animation):
         self.animation = animation
         self.update()
 
-    def drawEntity(self):
+    def drawEntity(self, pos):
         if self.heading == 1:
-            self.screen.blit(self.animation.image, self.entity.getPos())
+            self.screen.blit(self.animation.image, pos)
         elif self.heading == -1:
-            self.screen.blit(
-                flip(self.animation.image, True, False), self.entity.getPos()
-            )
+            self.screen.blit(transforms.flip(self.animation.image), pos)
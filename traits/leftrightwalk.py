@@ -1,15 +1,25 @@
-import random
-
-from classes.Collider import Collider
+from classes.Animation import clock
+from classes.Profiler import profiler
 
 
 class LeftRightWalkTrait:
+    __slots__ = ("direction", "entity", "collDetection", "speed", "walkedFrame")
+
     def __init__(self, entity, level):
-        self.direction = random.choice([-1, 1])
+        self.direction = level.random.choice([-1, 1])
         self.entity = entity
-        self.collDetection = Collider(self.entity, level)
+        self.collDetection = level.collider
         self.speed = 1
         self.entity.vel.x = self.speed * self.direction
+        self.walkedFrame = None
+
+    def walk(self):
+        # gravity and one step; skipped when WalkerPhysics already moved the
+        # entity this frame
+        if self.walkedFrame == clock.frame:
+            return
+        self.entity.applyGravity()
+        self.update()
 
     def update(self):
         if self.entity.vel.x == 0:
@@ -18,7 +28,9 @@ class LeftRightWalkTrait:
         self.moveEntity()
 
     def moveEntity(self):
+        start = profiler.begin()
         self.entity.rect.y += self.entity.vel.y
-        self.collDetection.checkY()
+        self.collDetection.checkY(self.entity)
         self.entity.rect.x += self.entity.vel.x
-        self.collDetection.checkX()
+        self.collDetection.checkX(self.entity)
+        profiler.end("collision", start)